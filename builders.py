@@ -3,9 +3,12 @@ from __future__ import annotations
 from . import shot_diet
 
 from collections.abc import Mapping
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
 
-from .core import apply_min_floor, apply_multipliers, apply_temperature, clamp, normalize_weights
+from .core import apply_min_floor, apply_temperature, clamp, normalize_weights_inplace
+from .game_config import is_mapping
 from .era import get_defense_meta_params
 from .tactics import TacticsConfig, canonical_defense_scheme
 
@@ -26,39 +29,69 @@ def _fallback_scheme(weights: Mapping[str, Any], fallback: str) -> Dict[str, flo
     return {}
 
 
+def action_base_lookup(game_cfg: "GameConfig") -> Any:
+    """Bound `aliases.get` for game_cfg; call as lookup(action, action) on hot paths."""
+    return game_cfg.derived("action_base_lookup", _action_aliases_get)
+
+
+def _action_aliases_get(game_cfg: "GameConfig") -> Any:
+    aliases = game_cfg.action_aliases if is_mapping(game_cfg.action_aliases) else {}
+    return aliases.get
+
+
 def get_action_base(action: str, game_cfg: "GameConfig") -> str:
-    aliases = game_cfg.action_aliases if isinstance(game_cfg.action_aliases, Mapping) else {}
-    return aliases.get(action, action)
+    return action_base_lookup(game_cfg)(action, action)
+
+
+def _action_weights_base(
+    off_tac: TacticsConfig,
+    def_tac: Optional[TacticsConfig],
+    game_cfg: "GameConfig",
+) -> Dict[str, float]:
+    scheme_weights = game_cfg.off_scheme_action_weights if is_mapping(game_cfg.off_scheme_action_weights) else {}
+    sharp = clamp(off_tac.scheme_weight_sharpness, 0.70, 1.40)
+    # 1) scheme sharpening first
+    block = scheme_weights.get(off_tac.offense_scheme)
+    if block is not None:
+        base = dict(_sharpened_scheme_weights(block, sharp))
+    else:
+        base = {a: (max(w, 0.0) ** sharp) for a, w in _fallback_scheme(scheme_weights, "Spread_HeavyPnR").items()}
+    # 2) offense UI multipliers
+    for a, m in off_tac.action_weight_mult.items():
+        base[a] = base.get(a, 0.5) * float(m)
+    # 3) defense can distort opponent action choice (e.g., transition defense priority)
+    if def_tac is not None:
+        for a, m in getattr(def_tac, 'opp_action_weight_mult', {}).items():
+            base[a] = base.get(a, 0.5) * float(m)
+    return base
+
 
 def build_offense_action_probs(
     off_tac: TacticsConfig,
     def_tac: Optional[TacticsConfig] = None,
     ctx: Optional[Dict[str, Any]] = None,
     game_cfg: Optional["GameConfig"] = None,
+    cache: Optional[Dict[Any, Any]] = None,
 ) -> Dict[str, float]:
     """Build offense action distribution.
 
     UI rule (fixed): normalize((W_scheme[action] ^ sharpness) * off_action_mult[action] * def_opp_action_mult[action]).
+
+    cache: optional possession-scoped dict (TeamState._possession_cache of the offense);
+    steps 1-3 depend only on the two tactics and are reused from it within a possession.
     """
     if game_cfg is None:
         raise ValueError("build_offense_action_probs requires game_cfg")
-    scheme_weights = game_cfg.off_scheme_action_weights if isinstance(game_cfg.off_scheme_action_weights, Mapping) else {}
-    base = dict(
-        scheme_weights.get(
-            off_tac.offense_scheme,
-            _fallback_scheme(scheme_weights, "Spread_HeavyPnR"),
-        )
-    )
-    sharp = clamp(off_tac.scheme_weight_sharpness, 0.70, 1.40)
-    # 1) scheme sharpening first
-    base = {a: (max(w, 0.0) ** sharp) for a, w in base.items()}
-    # 2) offense UI multipliers
-    for a, m in off_tac.action_weight_mult.items():
-        base[a] = base.get(a, 0.5) * float(m)
-    # 3) defense can distort opponent action choice (e.g., transition defense priority)
-    if def_tac is not None:
-        for a, m in getattr(def_tac, 'opp_action_weight_mult', {}).items():
-            base[a] = base.get(a, 0.5) * float(m)
+    if cache is None:
+        base = _action_weights_base(off_tac, def_tac, game_cfg)
+    else:
+        hit = cache.get("action_weights_base")
+        if hit is not None and hit[0] is off_tac and hit[1] is def_tac and hit[2] is game_cfg:
+            base = dict(hit[3])
+        else:
+            tac_base = _action_weights_base(off_tac, def_tac, game_cfg)
+            cache["action_weights_base"] = (off_tac, def_tac, game_cfg, tac_base)
+            base = dict(tac_base)
 
     context = ctx or {}
     # Pressure-driven action mix (continuous 0..1). Replaces legacy boolean clutch flag.
@@ -97,20 +130,11 @@ def build_offense_action_probs(
         base["PostUp"] = base.get("PostUp", 0.5) * 1.02
 
     if def_tac is None:
-        return normalize_weights(base)
-
-    meta = get_defense_meta_params()
-    tables = meta.get("defense_meta_action_mult_tables", {})
-    strength = float(meta.get("defense_meta_strength", 0.45))
-    lo = float(meta.get("defense_meta_clamp_lo", 0.80))
-    hi = float(meta.get("defense_meta_clamp_hi", 1.20))
-    temp = float(meta.get("defense_meta_temperature", 1.10))
-    floor = float(meta.get("defense_meta_floor", 0.03))
+        return normalize_weights_inplace(base)
 
     scheme = canonical_defense_scheme(getattr(def_tac, "defense_scheme", ""))
-    meta_mults = tables.get(scheme, {})
-    for a, mult in meta_mults.items():
-        mult_final = clamp(1.0 + (float(mult) - 1.0) * strength, lo, hi)
+    meta_mults, temp, floor = _defense_meta_action_ops(scheme)
+    for a, mult_final in meta_mults:
         base[a] = base.get(a, 0.5) * mult_final
 
     probs = apply_temperature(base, temp)
@@ -121,76 +145,167 @@ def build_offense_action_probs(
         tactic_name = ctx.get("tactic_name")
         if style is not None and tactic_name is not None:
             mult_by_base = shot_diet.get_action_multipliers(style, tactic_name)
+            base_of = action_base_lookup(game_cfg)
             for act in list(probs.keys()):
-                base_action = get_action_base(act, game_cfg)
+                base_action = base_of(act, act)
                 probs[act] = max(probs.get(act, 0.0) * mult_by_base.get(base_action, 1.0), 1e-6)
-    return normalize_weights(probs)
+    return normalize_weights_inplace(probs)
 
 
 def effective_scheme_multiplier(base_mult: float, strength: float) -> float:
     s = clamp(strength, 0.70, 1.40)
     return 1.0 + (float(base_mult) - 1.0) * s
 
+def _sharpened_scheme_weights(block: Any, sharp: float) -> Tuple[Tuple[str, float], ...]:
+    return tuple((a, max(w, 0.0) ** sharp) for a, w in block.items())
+
+
+def _effective_scheme_mults(sm: Any, strength: float) -> Tuple[Tuple[str, float], ...]:
+    return tuple((o, effective_scheme_multiplier(m, strength)) for o, m in sm.items())
+
+
+_EMPTY_MULT: Mapping[str, float] = MappingProxyType({})
+
+
+def _compile_nudges(spec: Dict[str, Dict[str, float]]) -> Tuple[Tuple[str, Tuple[Tuple[str, float], ...]], ...]:
+    # Neutral (1.0) entries are kept in the spec for tuning visibility but dropped here.
+    return tuple(
+        (tag, tuple((o, m) for o, m in mults.items() if m != 1.0))
+        for tag, mults in spec.items()
+        if any(m != 1.0 for m in mults.values())
+    )
+
+
+# Conditional outcome nudges applied after the scheme multipliers: defense scheme -> tag ->
+# {outcome: mult}, applied when tags[tag] is truthy.
+_CONDITIONAL_NUDGES = {
+    "ICE_SidePnR": _compile_nudges({
+        "is_side_pnr": {"RESET_RESREEN": 1.03, "PASS_KICKOUT": 1.03},
+    }),
+}
+
+def _scheme_mult_flat(game_cfg: "GameConfig") -> Tuple[Dict[Tuple[str, str], Any], Dict[Tuple[str, str], Any]]:
+    """(offense, defense) flat maps for game_cfg.
+
+    Filled lazily with (scheme, action) -> scheme_mult[scheme][action] or
+    scheme_mult[scheme][base(action)].
+    """
+    return game_cfg.derived("scheme_mult_flat", _new_scheme_mult_flat)
+
+
+def _new_scheme_mult_flat(game_cfg: "GameConfig") -> Tuple[Dict[Tuple[str, str], Any], Dict[Tuple[str, str], Any]]:
+    return {}, {}
+
+
+def _resolve_scheme_mult(
+    flat: Dict[Tuple[str, str], Any],
+    scheme_mult: Any,
+    scheme: str,
+    action: str,
+    base_action: str,
+) -> Any:
+    by_scheme = scheme_mult.get(scheme, _EMPTY_MULT) if is_mapping(scheme_mult) else _EMPTY_MULT
+    sm = by_scheme.get(action) or by_scheme.get(base_action) or _EMPTY_MULT
+    flat[(scheme, action)] = sm
+    return sm
+
 def _knob_mult(game_cfg: "GameConfig", key: str, default: float = 1.0) -> float:
-    knobs = game_cfg.knobs if isinstance(game_cfg.knobs, Mapping) else {}
+    knobs = game_cfg.knobs if is_mapping(game_cfg.knobs) else {}
     try:
         return float(knobs.get(key, default))
     except Exception:
         return float(default)
 
-def build_outcome_priors(
+def _outcome_priors_base(
     action: str,
+    base_action: str,
     off_tac: TacticsConfig,
     def_tac: TacticsConfig,
-    tags: Dict[str, Any],
-    ctx: Optional[Dict[str, Any]] = None,
-    game_cfg: Optional["GameConfig"] = None,
+    def_scheme: str,
+    game_cfg: "GameConfig",
 ) -> Dict[str, float]:
-    if game_cfg is None:
-        raise ValueError("build_outcome_priors requires game_cfg")
-    base_action = get_action_base(action, game_cfg)
-    priors = game_cfg.action_outcome_priors if isinstance(game_cfg.action_outcome_priors, Mapping) else {}
+    priors = game_cfg.action_outcome_priors if is_mapping(game_cfg.action_outcome_priors) else {}
     default_priors = priors.get("SpotUp") if "SpotUp" in priors else _fallback_scheme(priors, "")
     pri = dict(priors.get(base_action, default_priors))
 
-    # offense global
-    pri = apply_multipliers(pri, off_tac.outcome_global_mult)
-
-    # offense per-action
-    pri = apply_multipliers_typesafe(pri, off_tac.outcome_by_action_mult.get(action, {}))
-    pri = apply_multipliers_typesafe(pri, off_tac.outcome_by_action_mult.get(base_action, {}))
+    # offense global, then offense per-action (pri is our own copy, so mutate in place)
+    off_by_action = off_tac.outcome_by_action_mult
+    _apply_multipliers_inplace(
+        pri,
+        off_tac.outcome_global_mult,
+        off_by_action.get(action, _EMPTY_MULT),
+        off_by_action.get(base_action, _EMPTY_MULT),
+    )
 
     # offense scheme
-    off_mult = game_cfg.offense_scheme_mult if isinstance(game_cfg.offense_scheme_mult, Mapping) else {}
-    sm = off_mult.get(off_tac.offense_scheme, {}).get(action) or off_mult.get(off_tac.offense_scheme, {}).get(base_action) or {}
-    for o, m in sm.items():
-        if o in pri:
-            pri[o] *= effective_scheme_multiplier(m, off_tac.scheme_outcome_strength)
+    off_flat, def_flat = _scheme_mult_flat(game_cfg)
+    sm = off_flat.get((off_tac.offense_scheme, action))
+    if sm is None:
+        sm = _resolve_scheme_mult(off_flat, game_cfg.offense_scheme_mult, off_tac.offense_scheme, action, base_action)
+    if sm:
+        for o, eff in _effective_scheme_mults(sm, off_tac.scheme_outcome_strength):
+            if o in pri:
+                pri[o] *= eff
 
     # defense knobs on opponent priors
-    pri = apply_multipliers(pri, def_tac.opp_outcome_global_mult)
-    pri = apply_multipliers_typesafe(pri, def_tac.opp_outcome_by_action_mult.get(action, {}))
-    pri = apply_multipliers_typesafe(pri, def_tac.opp_outcome_by_action_mult.get(base_action, {}))
+    opp_by_action = def_tac.opp_outcome_by_action_mult
+    _apply_multipliers_inplace(
+        pri,
+        def_tac.opp_outcome_global_mult,
+        opp_by_action.get(action, _EMPTY_MULT),
+        opp_by_action.get(base_action, _EMPTY_MULT),
+    )
+
+    # defense scheme
+    dm = def_flat.get((def_scheme, action))
+    if dm is None:
+        dm = _resolve_scheme_mult(def_flat, game_cfg.defense_scheme_mult, def_scheme, action, base_action)
+    if dm:
+        for o, eff in _effective_scheme_mults(dm, def_tac.def_scheme_outcome_strength):
+            if o in pri:
+                pri[o] *= eff
+
+    return pri
+
+
+def build_outcome_priors(
+    action: str,
+    off_tac: TacticsConfig,
+    def_tac: TacticsConfig,
+    tags: Dict[str, Any],
+    ctx: Optional[Dict[str, Any]] = None,
+    game_cfg: Optional["GameConfig"] = None,
+    cache: Optional[Dict[Any, Any]] = None,
+) -> Dict[str, float]:
+    """Build the outcome prior distribution for one action step.
 
+    cache: optional possession-scoped dict (see build_offense_action_probs); the
+    tactics-only stage is shared by every step that runs `action` in the possession.
+    """
+    if game_cfg is None:
+        raise ValueError("build_outcome_priors requires game_cfg")
+    base_action = action_base_lookup(game_cfg)(action, action)
     def_scheme = canonical_defense_scheme(getattr(def_tac, "defense_scheme", ""))
 
-    # defense scheme
-    def_mult = game_cfg.defense_scheme_mult if isinstance(game_cfg.defense_scheme_mult, Mapping) else {}
-    dm = def_mult.get(def_scheme, {}).get(action) or def_mult.get(def_scheme, {}).get(base_action) or {}
-    for o, m in dm.items():
-        if o in pri:
-            pri[o] *= effective_scheme_multiplier(m, def_tac.def_scheme_outcome_strength)
+    # Tactics-only stage: era priors x offense/defense knobs and schemes.
+    if cache is None:
+        pri = _outcome_priors_base(action, base_action, off_tac, def_tac, def_scheme, game_cfg)
+    else:
+        key = ("outcome_priors_base", action)
+        hit = cache.get(key)
+        if hit is not None and hit[0] is off_tac and hit[1] is def_tac and hit[2] is game_cfg:
+            pri = dict(hit[3])
+        else:
+            base = _outcome_priors_base(action, base_action, off_tac, def_tac, def_scheme, game_cfg)
+            cache[key] = (off_tac, def_tac, game_cfg, base)
+            pri = dict(base)
 
     # conditional (MVP subset)
-    if def_scheme == "ICE_SidePnR" and tags.get("is_side_pnr", False):
-        for o in ("RESET_RESREEN","PASS_KICKOUT"):
-            if o in pri:
-                pri[o] *= 1.03
-
-    if tags.get("in_transition", False):
-        for o in ("TO_HANDLE_LOSS","TO_CHARGE","RESET_HUB","RESET_RESREEN"):
-            if o in pri:
-                pri[o] *= 1.0
+    for tag, nudges in _CONDITIONAL_NUDGES.get(def_scheme, ()):
+        if tags.get(tag, False):
+            for o, m in nudges:
+                if o in pri:
+                    pri[o] *= m
 
     avg_fatigue_off = tags.get("avg_fatigue_off")
     if isinstance(avg_fatigue_off, (int, float)):
@@ -213,8 +328,56 @@ def build_outcome_priors(
             if o.startswith("FOUL_"):
                 pri[o] = pri.get(o, 0.0) * foul_base
 
+    for op, target, val in _defense_meta_prior_ops(def_scheme, base_action):
+        if op == "add":
+            pri[target] = pri.get(target, 0.0) + val
+        elif target in pri:
+            if op == "mult":
+                pri[target] = pri[target] * val
+            else:  # "min"
+                pri[target] = max(pri[target], val)
+
+    # shot_diet wiring
+    context = ctx if ctx is not None else tags
+    style = context.get("shot_diet_style") if isinstance(context, Mapping) else None
+    tactic_name = context.get("tactic_name") if isinstance(context, Mapping) else None
+    if style is not None and tactic_name is not None:
+        out_mult = shot_diet.get_outcome_multipliers(style, tactic_name, base_action)
+        for outcome in list(pri.keys()):
+            pri[outcome] = max(pri.get(outcome, 0.0) * out_mult.get(outcome, 1.0), 1e-6)
+
+    return normalize_weights_inplace(pri)
+
+@lru_cache(maxsize=None)
+def _defense_meta_action_ops(def_scheme: str) -> Tuple[Tuple[Tuple[str, float], ...], float, float]:
+    """Resolve the defense-meta action multipliers for one scheme.
+
+    Returns ((action, clamped mult), ...), temperature, floor. The meta table is static,
+    so strength/clamp are applied once instead of cloning the params every possession.
+    """
     meta = get_defense_meta_params()
-    rules = meta.get("defense_meta_priors_rules", {})
+    tables = meta.get("defense_meta_action_mult_tables", {})
+    strength = float(meta.get("defense_meta_strength", 0.45))
+    lo = float(meta.get("defense_meta_clamp_lo", 0.80))
+    hi = float(meta.get("defense_meta_clamp_hi", 1.20))
+    temp = float(meta.get("defense_meta_temperature", 1.10))
+    floor = float(meta.get("defense_meta_floor", 0.03))
+    mults = tuple(
+        (a, clamp(1.0 + (float(mult) - 1.0) * strength, lo, hi))
+        for a, mult in tables.get(def_scheme, {}).items()
+    )
+    return mults, temp, floor
+
+
+@lru_cache(maxsize=None)
+def _defense_meta_prior_ops(def_scheme: str, base_action: str) -> Tuple[Tuple[str, str, float], ...]:
+    """Partially evaluate defense_meta_priors_rules for one (scheme, base_action).
+
+    The rule table is static, so the require_base_action filter and the per-rule
+    mult/add/min dispatch are resolved once into a flat op list (rule order kept).
+    """
+    rules = get_defense_meta_params().get("defense_meta_priors_rules", {})
+    ops = []
     for rule in rules.get(def_scheme, []):
         target = rule.get("key")
         if not target:
@@ -222,28 +385,19 @@ def build_outcome_priors(
         if rule.get("require_base_action") and rule.get("require_base_action") != base_action:
             continue
         if "mult" in rule:
-            if target in pri:
-                pri[target] = pri.get(target, 0.0) * float(rule.get("mult", 1.0))
+            ops.append(("mult", target, float(rule.get("mult", 1.0))))
         if "add" in rule:
-            pri[target] = pri.get(target, 0.0) + float(rule.get("add", 0.0))
+            ops.append(("add", target, float(rule.get("add", 0.0))))
         if "min" in rule:
-            if target in pri:
-                pri[target] = max(pri.get(target, 0.0), float(rule.get("min", 0.0)))
+            ops.append(("min", target, float(rule.get("min", 0.0))))
+    return tuple(ops)
 
-    # shot_diet wiring
-    context = ctx if ctx is not None else tags
-    style = context.get("shot_diet_style") if isinstance(context, Mapping) else None
-    tactic_name = context.get("tactic_name") if isinstance(context, Mapping) else None
-    if style is not None and tactic_name is not None:
-        out_mult = shot_diet.get_outcome_multipliers(style, tactic_name, base_action)
-        for outcome in list(pri.keys()):
-            pri[outcome] = max(pri.get(outcome, 0.0) * out_mult.get(outcome, 1.0), 1e-6)
 
-    return normalize_weights(pri)
-
-def apply_multipliers_typesafe(pri: Dict[str, float], mults: Dict[str, float]) -> Dict[str, float]:
-    out = dict(pri)
-    for o, m in mults.items():
-        if o in out:
-            out[o] *= float(m)
-    return out
+def _apply_multipliers_inplace(pri: Dict[str, float], *mults: Mapping[str, Any]) -> None:
+    """Same as chaining apply_multipliers over `mults` in order, without the per-step copies."""
+    for m in mults:
+        if not m:
+            continue
+        for o, v in m.items():
+            if o in pri:
+                pri[o] *= float(v)
@@ -0,0 +1,20 @@
+"""Process-wide cache reset.
+
+Values derived from an era config live on the GameConfig they were computed from
+(GameConfig.derived) and are dropped with it. What is left at module level are
+lru_caches over static tables / files and the era file cache; clear_caches() resets
+all of them (e.g. after editing tables or preset files inside a long-running process).
+"""
+from __future__ import annotations
+
+
+def clear_caches() -> None:
+    from . import builders, era, models, quality, shot_diet, sim_rotation
+
+    era.clear_era_cache()
+    shot_diet.clear_style_cache()
+    builders._defense_meta_action_ops.cache_clear()
+    builders._defense_meta_prior_ops.cache_clear()
+    quality.canonical_scheme.cache_clear()
+    models._fatigue_params_for_key.cache_clear()
+    sim_rotation._load_coach_presets.cache_clear()
@@ -306,6 +306,10 @@ _EXTRA_KEYS = set()
 for a in ARCHETYPES.values():
     _EXTRA_KEYS.update(a.bumps.keys())
 
+# Baseline key order for generate_player. Sorted so the sampling (and therefore RNG draw)
+# order does not depend on set iteration order / PYTHONHASHSEED.
+_ALL_DERIVED_KEYS: Tuple[str, ...] = tuple(sorted(set(REQUIRED_DERIVED_KEYS) | _EXTRA_KEYS))
+
 def _sample_stat(rng: random.Random, mu: float, sd: float, lo: float = 5.0, hi: float = 99.0) -> float:
     return _trunc_norm(rng, mu, sd, lo, hi)
 
@@ -320,9 +324,8 @@ def generate_player(
 
     # baseline distribution (league-ish)
     derived: Dict[str, float] = {}
-    all_keys = set(REQUIRED_DERIVED_KEYS) | set(_EXTRA_KEYS)
-    for k in all_keys:
-        derived[k] = _sample_stat(rng, mu=55.0, sd=12.0, lo=15.0, hi=92.0)
+    for k in _ALL_DERIVED_KEYS:
+        derived[k] = _trunc_norm(rng, 55.0, 12.0, 15.0, 92.0)
 
     # apply bumps
     for k, (mu, sd) in arch.bumps.items():
@@ -336,6 +339,21 @@ def generate_player(
 
     return Player(pid=str(pid), name=str(name), pos=str(arch.pos), derived=derived)
 
+def generate_players(
+    rng: random.Random,
+    *,
+    pids: List[str],
+    names: List[str],
+    archetypes: List[str],
+) -> List[Player]:
+    """Batch form of generate_player; players are drawn in list order (same RNG stream)."""
+    if not (len(pids) == len(names) == len(archetypes)):
+        raise ValueError("generate_players: pids/names/archetypes length mismatch")
+    return [
+        generate_player(rng, pid=pid, name=name, archetype=archetype)
+        for pid, name, archetype in zip(pids, names, archetypes)
+    ]
+
 def generate_tactics(
     rng: random.Random,
     profile: DirectionProfile,
@@ -512,10 +530,12 @@ def build_team(
     tac = generate_tactics(rng, profile)
     plan = _SCHEME_ROSTER_PLAN.get(tac.offense_scheme) or _SCHEME_ROSTER_PLAN["Spread_HeavyPnR"]
 
-    players: List[Player] = []
-    for i, archetype in enumerate(plan):
-        pid = f"{team_id}_{i:02d}"
-        players.append(generate_player(rng, pid=pid, name=f"{name}_{archetype}_{i:02d}", archetype=archetype))
+    players = generate_players(
+        rng,
+        pids=[f"{team_id}_{i:02d}" for i in range(len(plan))],
+        names=[f"{name}_{archetype}_{i:02d}" for i, archetype in enumerate(plan)],
+        archetypes=list(plan),
+    )
 
     roles = assign_roles_12(rng, players, tac.offense_scheme, unique_first_n=8)
     starters = _choose_starters(players, roles)
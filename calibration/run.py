@@ -23,25 +23,25 @@ def _ensure_schema_module() -> None:
 
     import types
     m = types.ModuleType("schema")
+    m.normalize_team_id = _shim_normalize_team_id  # type: ignore[attr-defined]
+    m.GameContext = _ShimGameContext  # type: ignore[attr-defined]
+    sys.modules["schema"] = m
 
-    def normalize_team_id(x: str) -> str:
-        return str(x or "").strip()
-
-    @dataclass
-    class GameContext:
-        game_id: str
-        home_team_id: str
-        away_team_id: str
+# Shim types live at module level so contexts can be pickled to worker processes (--workers).
+def _shim_normalize_team_id(x: str) -> str:
+    return str(x or "").strip()
 
-    m.normalize_team_id = normalize_team_id  # type: ignore[attr-defined]
-    m.GameContext = GameContext  # type: ignore[attr-defined]
-    sys.modules["schema"] = m
+@dataclass
+class _ShimGameContext:
+    game_id: str
+    home_team_id: str
+    away_team_id: str
 
 _ensure_schema_module()
 
 import schema  # type: ignore
 
-from ..sim_game import simulate_game
+from ..sim_game import simulate_game, simulate_games_parallel
 from ..era import load_era_config
 from ..game_config import build_game_config
 from .generate import PROFILES, build_team, DEFENSE_SCHEMES, OFFENSE_SCHEMES
@@ -66,7 +66,15 @@ def run_calibration(
     replay_disabled: bool = True,
     strict_validation: bool = False,
     store_per_game: bool = False,
+    workers: Optional[int] = None,
 ) -> Dict[str, Any]:
+    """Run n_games calibration games and aggregate league team-game stats.
+
+    workers=None (default) keeps the single rng stream: teams are built and each game is
+    simulated on `rng` in turn. With workers=N, teams are still built on `rng`, but game i
+    runs on its own Random(seed + i) via simulate_games_parallel, so results do not depend
+    on N (but differ from the workers=None stream).
+    """
     rng = random.Random(int(seed))
 
     # Validate schemes from era (optional, but helps avoid drift)
@@ -85,6 +93,24 @@ def run_calibration(
     scheme_counts_off: Dict[str, int] = {}
     scheme_counts_def: Dict[str, int] = {}
 
+    def _accumulate(i: int, result: Dict[str, Any], meta_h: Dict[str, Any], meta_a: Dict[str, Any]) -> None:
+        # Extract and accumulate team summaries as "league samples" (2 samples per game)
+        teams = result.get("teams", {}) or {}
+        for tid, summ in teams.items():
+            league_acc.add(_team_to_calib_metrics(summ))
+
+        if store_per_game:
+            per_game.append({
+                "game_index": i,
+                "meta": result.get("meta", {}),
+                "possessions_per_team": result.get("possessions_per_team", None),
+                "teams": {k: _team_to_calib_metrics(v) for k, v in teams.items()},
+            })
+            inputs.append({"home": meta_h, "away": meta_a})
+
+    pending: List[Tuple[Any, Any, Any]] = []
+    pending_meta: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+
     for i in range(int(n_games)):
         home_id = f"H{i:04d}"
         away_id = f"A{i:04d}"
@@ -118,6 +144,11 @@ def run_calibration(
             away_team_id=away_id,
         )
 
+        if workers is not None:
+            pending.append((home, away, ctx))
+            pending_meta.append((meta_h, meta_a))
+            continue
+
         result = simulate_game(
             rng,
             home,
@@ -127,20 +158,19 @@ def run_calibration(
             strict_validation=bool(strict_validation),
             replay_disabled=bool(replay_disabled),
         )
+        _accumulate(i, result, meta_h, meta_a)
 
-        # Extract and accumulate team summaries as "league samples" (2 samples per game)
-        teams = result.get("teams", {}) or {}
-        for tid, summ in teams.items():
-            league_acc.add(_team_to_calib_metrics(summ))
-
-        if store_per_game:
-            per_game.append({
-                "game_index": i,
-                "meta": result.get("meta", {}),
-                "possessions_per_team": result.get("possessions_per_team", None),
-                "teams": {k: _team_to_calib_metrics(v) for k, v in teams.items()},
-            })
-            inputs.append({"home": meta_h, "away": meta_a})
+    if pending:
+        results = simulate_games_parallel(
+            pending,
+            base_seed=int(seed),
+            max_workers=int(workers) if workers is not None else None,
+            era=era,
+            strict_validation=bool(strict_validation),
+            replay_disabled=bool(replay_disabled),
+        )
+        for i, (result, (meta_h, meta_a)) in enumerate(zip(results, pending_meta)):
+            _accumulate(i, result, meta_h, meta_a)
 
     avg = league_acc.mean()
 
@@ -186,6 +216,8 @@ def run_calibration(
         "league_team_game_dist": dist,       # std + percentiles of team-game samples (2*N)
         "league_avg_derived": derived,
     }
+    if workers is not None:
+        out["meta"]["workers"] = int(workers)
     if store_per_game:
         out["inputs"] = inputs
         out["per_game"] = per_game
@@ -201,6 +233,7 @@ def main() -> None:
     ap.add_argument("--replay", action="store_true", help="Include replay emission (slower, bigger output).")
     ap.add_argument("--strict", action="store_true", help="Strict input validation (raise on issues).")
     ap.add_argument("--store_per_game", action="store_true", help="Store per-game outputs (very large).")
+    ap.add_argument("--workers", type=int, default=None, help="Simulate games in N processes (per-game seeds).")
     ap.add_argument("--out", type=str, default="calibration_output.json")
     args = ap.parse_args()
 
@@ -212,6 +245,7 @@ def main() -> None:
         replay_disabled=(not args.replay),
         strict_validation=args.strict,
         store_per_game=args.store_per_game,
+        workers=args.workers,
     )
 
     out_path = str(args.out)
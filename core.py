@@ -23,79 +23,150 @@ You can integrate by:
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
-import math, random, json, hashlib, pickle, os, copy, warnings
+from typing import Dict, List, Optional, Sequence, Tuple, Any
+import math, random, hashlib, os, copy, struct, warnings
+from collections.abc import Mapping
 
 
-ENGINE_VERSION: str = "mvp_plus_0.2"
+ENGINE_VERSION: str = "mvp_plus_0.3"
 
 def make_replay_token(rng: random.Random, home: 'TeamState', away: 'TeamState', era: str = "default") -> str:
     """Create a short stable token to reproduce/debug a game.
 
     Token is derived from: engine version, era, RNG state hash, rosters, roles, and tactics.
     """
-    try:
-        state_bytes = pickle.dumps(rng.getstate())
-        rng_hash = hashlib.sha256(state_bytes).hexdigest()
-    except Exception as exc:
-        warnings.warn(f"make_replay_token: failed to hash RNG state ({type(exc).__name__}: {exc})")
-        rng_hash = "no_state"
-
-    def _player_payload(p: 'Player') -> Dict[str, Any]:
-        # Keep it deterministic; derived is already 0~100 numbers
-        return {
-            'pid': p.pid,
-            'pos': p.pos,
-            'derived': p.derived,
-        }
-
-    def _tactics_payload(t: 'TacticsConfig') -> Dict[str, Any]:
-        return {
-            'offense_scheme': t.offense_scheme,
-            'defense_scheme': t.defense_scheme,
-            'scheme_weight_sharpness': t.scheme_weight_sharpness,
-            'scheme_outcome_strength': t.scheme_outcome_strength,
-            'def_scheme_weight_sharpness': t.def_scheme_weight_sharpness,
-            'def_scheme_outcome_strength': t.def_scheme_outcome_strength,
-            'action_weight_mult': t.action_weight_mult,
-            'outcome_global_mult': t.outcome_global_mult,
-            'outcome_by_action_mult': t.outcome_by_action_mult,
-            'opp_action_weight_mult': getattr(t, 'opp_action_weight_mult', {}),
-            'opp_outcome_global_mult': t.opp_outcome_global_mult,
-            'opp_outcome_by_action_mult': t.opp_outcome_by_action_mult,
-            'context': t.context,
-        }
+    return str(LazyReplayToken(rng, home, away, era))
+
+
+class LazyReplayToken:
+    """Replay token whose hashing is deferred until str()/repr() is taken.
+
+    Only the RNG state is snapshotted at construction (a tuple copy); the
+    roster/tactics payload is read from `home`/`away` when the token is first
+    rendered, so callers must render it before mutating the teams again.
+    """
+
+    __slots__ = ("_rng_state", "_home", "_away", "_era", "_cached")
+
+    def __init__(self, rng: random.Random, home: 'TeamState', away: 'TeamState', era: str = "default") -> None:
+        home_id = str(getattr(home, "team_id", "") or "").strip()
+        away_id = str(getattr(away, "team_id", "") or "").strip()
+        if not home_id or not away_id:
+            raise ValueError("make_replay_token: home/away TeamState.team_id must be set")
+        if home_id == away_id:
+            raise ValueError(f"make_replay_token: home_id == away_id == {home_id!r}")
+        try:
+            self._rng_state = rng.getstate()
+        except Exception as exc:
+            warnings.warn(f"make_replay_token: failed to hash RNG state ({type(exc).__name__}: {exc})")
+            self._rng_state = None
+        self._home = home
+        self._away = away
+        self._era = era
+        self._cached: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._cached is None:
+            self._cached = _compute_replay_token(self._rng_state, self._home, self._away, self._era)
+            self._home = self._away = self._rng_state = None
+        return self._cached
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+def _compute_replay_token(rng_state: Any, home: 'TeamState', away: 'TeamState', era: Any) -> str:
+    rng_hash = "no_state"
+    if rng_state is not None:
+        try:
+            # random.Random state = (version, 625 x uint32 MT words, gauss_next).
+            # Hash the raw words directly instead of pickling the whole tuple; explicit
+            # little-endian like the float fields, so tokens match across hosts.
+            version, internal, gauss_next = rng_state
+            h = hashlib.blake2b(struct.pack(f"<{len(internal)}I", *internal), digest_size=16)
+            h.update(repr((version, gauss_next)).encode("ascii"))
+            rng_hash = h.hexdigest()
+        except Exception as exc:
+            warnings.warn(f"make_replay_token: failed to hash RNG state ({type(exc).__name__}: {exc})")
 
     home_id = str(getattr(home, "team_id", "") or "").strip()
     away_id = str(getattr(away, "team_id", "") or "").strip()
-    if not home_id or not away_id:
-        raise ValueError("make_replay_token: home/away TeamState.team_id must be set")
-    if home_id == away_id:
-        raise ValueError(f"make_replay_token: home_id == away_id == {home_id!r}")
-
-    payload = {
-        "engine_version": ENGINE_VERSION,
-        "era": era,
-        "rng_state_hash": rng_hash,
-        "teams": {
-            home_id: {
-                "team_id": home_id,
-                "name": home.name,
-                "roles": home.roles,
-                "lineup": [_player_payload(p) for p in home.lineup],
-                "tactics": _tactics_payload(home.tactics),
-            },
-            away_id: {
-                "team_id": away_id,
-                "name": away.name,
-                "roles": away.roles,
-                "lineup": [_player_payload(p) for p in away.lineup],
-                "tactics": _tactics_payload(away.tactics),
-            },
-        },
-    }
-    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode('utf-8')
-    return hashlib.sha256(raw).hexdigest()[:12]
+
+    # Stream a canonical, type-tagged encoding straight into the hasher
+    # (no intermediate payload dict / json encode; dict keys are sorted like sort_keys=True).
+    h = hashlib.blake2b(digest_size=16)
+    feed = _token_feed(h)
+    feed(ENGINE_VERSION)
+    feed(era)
+    feed(rng_hash)
+    for tid, team in sorted(((home_id, home), (away_id, away))):
+        t = team.tactics
+        feed(tid)
+        feed(team.name)
+        feed(team.roles)
+        feed(len(team.lineup))
+        for p in team.lineup:
+            # Keep it deterministic; derived is already 0~100 numbers
+            feed(p.pid)
+            feed(p.pos)
+            feed(p.derived)
+        for v in (
+            t.offense_scheme,
+            t.defense_scheme,
+            t.scheme_weight_sharpness,
+            t.scheme_outcome_strength,
+            t.def_scheme_weight_sharpness,
+            t.def_scheme_outcome_strength,
+            t.action_weight_mult,
+            t.outcome_global_mult,
+            t.outcome_by_action_mult,
+            getattr(t, 'opp_action_weight_mult', {}),
+            t.opp_outcome_global_mult,
+            t.opp_outcome_by_action_mult,
+            t.context,
+        ):
+            feed(v)
+    return h.hexdigest()[:12]
+
+
+def _token_feed(h: Any):
+    """Return feed(obj): length-prefixed, type-tagged canonical encoding of obj into h."""
+    update = h.update
+    pack_d = struct.Struct("<d").pack
+    pack_q = struct.Struct("<q").pack
+
+    def _bytes(tag: bytes, b: bytes) -> None:
+        update(tag)
+        update(pack_q(len(b)))
+        update(b)
+
+    def feed(obj: Any) -> None:
+        if obj is None:
+            update(b"N")
+        elif obj is True or obj is False:
+            update(b"T" if obj else b"F")
+        elif isinstance(obj, int):
+            _bytes(b"i", str(obj).encode("ascii"))
+        elif isinstance(obj, float):
+            update(b"f")
+            update(pack_d(obj))
+        elif isinstance(obj, str):
+            _bytes(b"s", obj.encode("utf-8"))
+        elif isinstance(obj, Mapping):
+            update(b"d")
+            update(pack_q(len(obj)))
+            for k, v in sorted(obj.items(), key=lambda kv: str(kv[0])):
+                feed(str(k))
+                feed(v)
+        elif isinstance(obj, (list, tuple)):
+            update(b"l")
+            update(pack_q(len(obj)))
+            for v in obj:
+                feed(v)
+        else:
+            _bytes(b"r", repr(obj).encode("utf-8"))
+
+    return feed
 
 # -------------------------
 # Helpers
@@ -112,6 +183,26 @@ def sigmoid(x: float) -> float:
         z = math.exp(x)
         return z / (1.0 + z)
 
+# Piecewise-linear logistic table on [-8, 8] (257 knots, step 1/16).
+# Max abs error vs sigmoid(): ~5e-5 inside the table range, <= 3.4e-4 in the
+# saturated tails (clamped to the endpoint values). Opt-in via
+# prob_model["sigmoid_lut"]; the exact sigmoid() remains the default.
+_SIG_LUT_LO = -8.0
+_SIG_LUT_HI = 8.0
+_SIG_LUT_STEPS_PER_UNIT = 16.0
+_SIG_LUT: Tuple[float, ...] = tuple(sigmoid(_SIG_LUT_LO + i / _SIG_LUT_STEPS_PER_UNIT) for i in range(257))
+
+
+def sigmoid_lut(x: float) -> float:
+    if x <= _SIG_LUT_LO:
+        return _SIG_LUT[0]
+    if x >= _SIG_LUT_HI:
+        return _SIG_LUT[256]
+    t = (x - _SIG_LUT_LO) * _SIG_LUT_STEPS_PER_UNIT
+    i = int(t)
+    a = _SIG_LUT[i]
+    return a + (t - i) * (_SIG_LUT[i + 1] - a)
+
 def normalize_weights(d: Dict[str, float]) -> Dict[str, float]:
     s = sum(max(v, 0.0) for v in d.values())
     if s <= 1e-12:
@@ -120,19 +211,37 @@ def normalize_weights(d: Dict[str, float]) -> Dict[str, float]:
     return {k: max(v, 0.0) / s for k, v in d.items()}
 
 
+def normalize_weights_inplace(d: Dict[str, float]) -> Dict[str, float]:
+    """normalize_weights that rewrites `d` in place and returns it.
+
+    Only for dicts the caller owns (freshly built weight/prior dicts); saves the second
+    dict allocation on the per-possession builders.
+    """
+    s = sum(max(v, 0.0) for v in d.values())
+    if s <= 1e-12:
+        if d:
+            u = 1.0 / len(d)
+            for k in d:
+                d[k] = u
+        return d
+    for k, v in d.items():
+        d[k] = max(v, 0.0) / s
+    return d
+
+
 def apply_temperature(weights: Dict[str, float], T: float) -> Dict[str, float]:
     if not weights:
         return {}
     exp = 1.0 / float(T) if float(T) != 0 else 1.0
     adj = {k: max(v, 0.0) ** exp for k, v in weights.items()}
-    return normalize_weights(adj)
+    return normalize_weights_inplace(adj)
 
 
 def apply_min_floor(probs: Dict[str, float], floor: float) -> Dict[str, float]:
     if not probs:
         return {}
     floored = {k: max(v, float(floor)) for k, v in probs.items()}
-    return normalize_weights(floored)
+    return normalize_weights_inplace(floored)
 
 def weighted_choice(rng: random.Random, weights: Dict[str, float]) -> str:
     total = sum(max(w, 0.0) for w in weights.values())
@@ -147,6 +256,24 @@ def weighted_choice(rng: random.Random, weights: Dict[str, float]) -> str:
             return k
     return next(iter(weights.keys()))
 
+def weighted_choice_index(rng: random.Random, weights: Sequence[float]) -> int:
+    """weighted_choice over a positional weight list; returns the chosen index.
+
+    Same draw and same cumulative scan as weighted_choice (one rng.random() call), so
+    replacing a {unique_key: w} dict with a list in the same order picks the same item.
+    """
+    total = sum(max(w, 0.0) for w in weights)
+    if total <= 1e-12:
+        return 0
+    r = rng.random() * total
+    upto = 0.0
+    for i, w in enumerate(weights):
+        w = max(w, 0.0)
+        upto += w
+        if upto >= r:
+            return i
+    return 0
+
 def dot_profile(vals: Dict[str, float], profile: Dict[str, float], missing_default: float = 50.0) -> float:
     s = 0.0
     for k, w in profile.items():
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import math
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence
 
 from .models import TeamState
 
@@ -68,13 +68,20 @@ def _softmax_mean(vals: List[float], beta: float) -> float:
 
 
 def _agg_anchor(lineup, key: str) -> float:
-    vals = [_safe_stat(p, key) for p in (lineup or [])]
+    return _agg_anchor_vals([_safe_stat(p, key) for p in (lineup or [])])
+
+
+def _agg_anchor_vals(vals: Sequence[float]) -> float:
     if DEF_SNAPSHOT_METHOD == "softmax":
         return _softmax_mean(vals, DEF_SNAPSHOT_SOFTMAX_BETA)
     # default: top-k mean
     return _topk_mean(vals, DEF_SNAPSHOT_TOPK)
 
 
+# Column order of the per-player stat table in team_def_snapshot.
+_SNAPSHOT_KEYS = ("DEF_POA", "DEF_RIM", "DEF_STEAL", "DEF_HELP", "PHYSICAL", "ENDURANCE", "DEF_POST")
+
+
 def team_def_snapshot(team: TeamState) -> Dict[str, float]:
     # Use ON-COURT players for defensive snapshot.
     # Fallback to full roster only if on-court data is unavailable.
@@ -97,21 +104,19 @@ def team_def_snapshot(team: TeamState) -> Dict[str, float]:
             "ENDURANCE": 50.0,
         }
 
-    # Anchor axes: use top-2 mean (or softmax mean) instead of max()
-    def_poa = _agg_anchor(lineup, "DEF_POA")
-    def_rim = _agg_anchor(lineup, "DEF_RIM")
-    def_steal = _agg_anchor(lineup, "DEF_STEAL")
+    # One pass over the lineup builds a (player x key) table; each axis is then a column.
+    rows = [[_safe_stat(p, k) for k in _SNAPSHOT_KEYS] for p in lineup]
+    poa, rim, steal, help_, physical, endurance, post = zip(*rows)
+    n = float(len(lineup))
 
+    # Anchor axes: use top-2 mean (or softmax mean) instead of max()
     # Remaining axes: simple lineup mean (kept as-is)
-    avg_keys = ["DEF_HELP", "PHYSICAL", "ENDURANCE", "DEF_POST"]
-    avg = {k: sum(_safe_stat(p, k) for p in lineup) / float(len(lineup)) for k in avg_keys}
-
     return {
-        "DEF_POA": def_poa,
-        "DEF_RIM": def_rim,
-        "DEF_STEAL": def_steal,
-        "DEF_HELP": avg["DEF_HELP"],
-        "DEF_POST": avg["DEF_POST"],
-        "PHYSICAL": avg["PHYSICAL"],
-        "ENDURANCE": avg["ENDURANCE"],
+        "DEF_POA": _agg_anchor_vals(poa),
+        "DEF_RIM": _agg_anchor_vals(rim),
+        "DEF_STEAL": _agg_anchor_vals(steal),
+        "DEF_HELP": sum(help_) / n,
+        "DEF_POST": sum(post) / n,
+        "PHYSICAL": sum(physical) / n,
+        "ENDURANCE": sum(endurance) / n,
     }
@@ -3,7 +3,10 @@ from __future__ import annotations
 import copy
 import json
 import os
+import sys
+from collections import OrderedDict
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Tuple
 
 
@@ -29,6 +32,10 @@ DEFAULT_PROB_MODEL: Dict[str, float] = {
     "prob_min": 0.03,
     "prob_max": 0.97,
 
+    # 1 = use the piecewise-linear sigmoid table (core.sigmoid_lut, max err ~3e-4)
+    # 0 = exact logistic (default; keep for validation/calibration runs)
+    "sigmoid_lut": 0,
+
     # OffScore-DefScore scaling (bigger = less sensitive)
     "shot_scale": 18.0,
     "pass_scale": 20.0,
@@ -471,39 +478,60 @@ ERA_TARGETS: Dict[str, Dict[str, Any]] = {
 }
 
 # Snapshot built-in defaults (used as fallback if era json is missing keys)
+_ATOMIC_TYPES = (str, int, float, bool, type(None))
+
+
+def _fast_clone(o: Any) -> Any:
+    """Deep-copy JSON-like era data (dict/list/tuple/scalars) without deepcopy's memo/dispatch.
+
+    Read-only mapping views (e.g. profiles tables) are thawed into plain dicts.
+    Anything else falls back to copy.deepcopy.
+    """
+    t = type(o)
+    if t is dict or t is MappingProxyType:
+        return {k: _fast_clone(v) for k, v in o.items()}
+    if t is list:
+        return [_fast_clone(v) for v in o]
+    if t in _ATOMIC_TYPES:
+        return o
+    if t is tuple:
+        return tuple(_fast_clone(v) for v in o)
+    return copy.deepcopy(o)
+
+
 DEFAULT_ERA: Dict[str, Any] = {
     "name": "builtin_default",
     "version": "1.0",
     "knobs": {"mult_lo": 0.70, "mult_hi": 1.40},
     "prob_model": dict(DEFAULT_PROB_MODEL),
 
-    "logistic_params": copy.deepcopy(DEFAULT_LOGISTIC_PARAMS),
-    "variance_params": copy.deepcopy(DEFAULT_VARIANCE_PARAMS),
+    "logistic_params": _fast_clone(DEFAULT_LOGISTIC_PARAMS),
+    "variance_params": _fast_clone(DEFAULT_VARIANCE_PARAMS),
 
     "role_fit": {"default_strength": 0.65},
 
-    "shot_base": dict(SHOT_BASE),
-    "pass_base_success": dict(PASS_BASE_SUCCESS),
+    "shot_base": _fast_clone(SHOT_BASE),
+    "pass_base_success": _fast_clone(PASS_BASE_SUCCESS),
 
-    "action_outcome_priors": copy.deepcopy(ACTION_OUTCOME_PRIORS),
-    "action_aliases": dict(ACTION_ALIASES),
+    "action_outcome_priors": _fast_clone(ACTION_OUTCOME_PRIORS),
+    "action_aliases": _fast_clone(ACTION_ALIASES),
 
-    "off_scheme_action_weights": copy.deepcopy(OFF_SCHEME_ACTION_WEIGHTS),
+    "off_scheme_action_weights": _fast_clone(OFF_SCHEME_ACTION_WEIGHTS),
 
-    "offense_scheme_mult": copy.deepcopy(OFFENSE_SCHEME_MULT),
-    "defense_scheme_mult": copy.deepcopy(DEFENSE_SCHEME_MULT),
+    "offense_scheme_mult": _fast_clone(OFFENSE_SCHEME_MULT),
+    "defense_scheme_mult": _fast_clone(DEFENSE_SCHEME_MULT),
 }
 
 def get_mvp_rules() -> Dict[str, Any]:
-    return copy.deepcopy(MVP_RULES)
+    return _fast_clone(MVP_RULES)
 
 
 def get_defense_meta_params() -> Dict[str, Any]:
-    return copy.deepcopy(DEFENSE_META_PARAMS)
+    return _fast_clone(DEFENSE_META_PARAMS)
 
 
 def get_era_targets(name: str) -> Dict[str, Any]:
-    return copy.deepcopy(ERA_TARGETS.get(name, ERA_TARGETS.get("era_modern_nbaish_v1", {})))
+    return _fast_clone(ERA_TARGETS.get(name, ERA_TARGETS.get("era_modern_nbaish_v1", {})))
 
 
 def _resolve_era_path(era_name: str) -> Optional[str]:
@@ -527,10 +555,61 @@ def _resolve_era_path(era_name: str) -> Optional[str]:
     return None
 
 
+# (era_name, path) -> (mtime, config, warnings, errors), least recently used first.
+# 시즌 단위 Monte Carlo에서 매 경기 era 파일 파싱 + DEFAULT_ERA 복사를 반복하지 않도록 캐시한다.
+# 파일이 수정되면(mtime 변경) miss가 되어 다시 로드되고, 같은 경로의 이전 버전은 덮어쓴다.
+# 여러 era 파일을 순회하는 장기 프로세스를 위해 항목 수도 _ERA_CACHE_MAX로 제한한다.
+_ERA_CACHE_MAX = 32
+_ERA_CACHE: OrderedDict[Tuple[str, Optional[str]], Tuple[Optional[float], Dict[str, Any], List[str], List[str]]] = OrderedDict()
+
+
+def _era_cache_hit(key: Tuple[str, Optional[str], Optional[float]]) -> Optional[Tuple[Dict[str, Any], List[str], List[str]]]:
+    slot = key[:2]
+    hit = _ERA_CACHE.get(slot)
+    if hit is None or hit[0] != key[2]:
+        return None
+    _ERA_CACHE.move_to_end(slot)
+    _, cfg, warnings, errors = hit
+    # 캐시 항목은 호출자와 공유하지 않는다: 매 hit마다 독립 복사본을 돌려준다
+    # (파싱/검증 비용만 아끼고, 반환된 dict를 수정해도 캐시/DEFAULT_ERA는 오염되지 않음).
+    return _fast_clone(cfg), list(warnings), list(errors)
+
+
+def _era_cache_put(
+    key: Tuple[str, Optional[str], Optional[float]],
+    cfg: Dict[str, Any],
+    warnings: List[str],
+    errors: List[str],
+) -> Tuple[Dict[str, Any], List[str], List[str]]:
+    slot = key[:2]
+    _ERA_CACHE[slot] = (key[2], cfg, list(warnings), list(errors))
+    _ERA_CACHE.move_to_end(slot)
+    while len(_ERA_CACHE) > _ERA_CACHE_MAX:
+        _ERA_CACHE.popitem(last=False)
+    return _fast_clone(cfg), warnings, errors
+
+
+def clear_era_cache() -> None:
+    """Drop every cached era config (see also caches.clear_caches)."""
+    _ERA_CACHE.clear()
+
+
+def clone_era(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a fully independent copy of an era config."""
+    return _fast_clone(cfg)
+
+
 def load_era_config(era: Any) -> Tuple[Dict[str, Any], List[str], List[str]]:
-    """Load an era config (dict) + return (config, warnings, errors)."""
+    """Load an era config (dict) + return (config, warnings, errors).
+
+    File-based eras are cached per (name, path) and reloaded when the file's mtime
+    changes; the cache keeps at most _ERA_CACHE_MAX eras (least recently used are
+    evicted) and clear_era_cache() empties it. Every call returns an independent copy,
+    so callers may edit it freely.
+    """
     warnings: List[str] = []
     errors: List[str] = []
+    cache_key: Optional[Tuple[str, Optional[str], Optional[float]]] = None
 
     if isinstance(era, dict):
         raw = era
@@ -539,23 +618,36 @@ def load_era_config(era: Any) -> Tuple[Dict[str, Any], List[str], List[str]]:
         era_name = str(era or "default")
         path = _resolve_era_path("default" if era_name == "default" else era_name)
         if path is None:
+            cache_key = (era_name, None, None)
+            hit = _era_cache_hit(cache_key)
+            if hit is not None:
+                return hit
             warnings.append(f"era file not found for '{era_name}', using built-in defaults")
-            cfg = copy.deepcopy(DEFAULT_ERA)
+            cfg = _fast_clone(DEFAULT_ERA)
             cfg["name"] = era_name
-            return cfg, warnings, errors
+            return _era_cache_put(cache_key, cfg, warnings, errors)
+
+        try:
+            cache_key = (era_name, path, os.path.getmtime(path))
+        except OSError:
+            cache_key = None
+        if cache_key is not None:
+            hit = _era_cache_hit(cache_key)
+            if hit is not None:
+                return hit
 
         try:
             with open(path, "r", encoding="utf-8") as f:
                 raw = json.load(f)
         except Exception as e:
             errors.append(f"failed to read era json ({path}): {e}")
-            cfg = copy.deepcopy(DEFAULT_ERA)
+            cfg = _fast_clone(DEFAULT_ERA)
             cfg["name"] = era_name
             return cfg, warnings, errors
 
         if not isinstance(raw, dict):
             errors.append(f"era json root must be an object/dict (got {type(raw).__name__})")
-            cfg = copy.deepcopy(DEFAULT_ERA)
+            cfg = _fast_clone(DEFAULT_ERA)
             cfg["name"] = era_name
             return cfg, warnings, errors
 
@@ -566,17 +658,41 @@ def load_era_config(era: Any) -> Tuple[Dict[str, Any], List[str], List[str]]:
     cfg["name"] = str(raw.get("name") or era_name)
     cfg["version"] = str(raw.get("version") or cfg.get("version") or "1.0")
 
+    if cache_key is not None:
+        return _era_cache_put(cache_key, cfg, warnings, errors)
     return cfg, warnings, errors
 
 
+# Table blocks whose keys (and alias/str values) are used as action/outcome/scheme lookups.
+_INTERNED_ERA_BLOCKS = (
+    "shot_base", "pass_base_success",
+    "action_outcome_priors", "action_aliases",
+    "off_scheme_action_weights", "def_scheme_action_weights",
+    "offense_scheme_mult", "defense_scheme_mult",
+)
+
+
+def _intern_keys(value: Any) -> Any:
+    """Recursively sys.intern str keys/values of JSON-loaded tables (new dicts; input untouched)."""
+    if isinstance(value, dict):
+        return {(sys.intern(k) if type(k) is str else k): _intern_keys(v) for k, v in value.items()}
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
 def validate_and_fill_era_dict(raw: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str], List[str]]:
     """Validate an era dict and fill missing keys from DEFAULT_ERA."""
     warnings: List[str] = []
     errors: List[str] = []
 
-    cfg = copy.deepcopy(DEFAULT_ERA)
+    # raw가 덮어쓰는 블록은 복사할 필요가 없으므로, 남는 기본 블록만 복제한다.
+    # (키 순서는 DEFAULT_ERA 기준 그대로 유지)
+    cfg = {k: (None if k in raw else _fast_clone(v)) for k, v in DEFAULT_ERA.items()}
     for k, v in raw.items():
-        cfg[k] = v
+        # JSON-parsed keys are not interned (unlike literals in profiles_data); intern them
+        # so era-driven dict lookups hit the identity fast path.
+        cfg[k] = _intern_keys(v) if k in _INTERNED_ERA_BLOCKS else v
 
     required_blocks = [
         "shot_base", "pass_base_success",
@@ -589,13 +705,13 @@ def validate_and_fill_era_dict(raw: Dict[str, Any]) -> Tuple[Dict[str, Any], Lis
     for k in required_blocks:
         if k not in cfg or cfg[k] is None:
             warnings.append(f"missing key '{k}' (filled from defaults)")
-            cfg[k] = copy.deepcopy(DEFAULT_ERA.get(k))
+            cfg[k] = _fast_clone(DEFAULT_ERA.get(k))
 
     dict_blocks = list(required_blocks)
     for k in dict_blocks:
         if not isinstance(cfg.get(k), dict):
             errors.append(f"'{k}' must be an object/dict (got {type(cfg.get(k)).__name__}); using defaults")
-            cfg[k] = copy.deepcopy(DEFAULT_ERA.get(k))
+            cfg[k] = _fast_clone(DEFAULT_ERA.get(k))
 
     # Light sanity warnings
     for kk, vv in (cfg.get("prob_model") or {}).items():
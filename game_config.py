@@ -1,10 +1,20 @@
 from __future__ import annotations
 
-import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from types import MappingProxyType
 from collections.abc import Mapping
-from typing import Any
+from typing import Any, Callable, Dict
+
+
+def is_mapping(value: Any) -> bool:
+    """isinstance(value, Mapping) with a type-identity fast path.
+
+    GameConfig fields are MappingProxyType and era/ctx blocks are plain dicts; checking
+    those two exact types first skips the ABC __instancecheck__ on hot paths. Other
+    Mapping implementations still go through isinstance.
+    """
+    t = type(value)
+    return t is MappingProxyType or t is dict or isinstance(value, Mapping)
 
 
 def _freeze_mapping(value: Any) -> Any:
@@ -37,13 +47,26 @@ class GameConfig:
     def_scheme_action_weights: Mapping[str, Any]
     offense_scheme_mult: Mapping[str, Any]
     defense_scheme_mult: Mapping[str, Any]
+    # Values derived from this config (prob-model constants, flattened tables, ...); see
+    # derived(). Every GameConfig starts empty, so a rebuilt config never sees values
+    # computed from an older one.
+    _cache: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def derived(self, key: str, factory: Callable[["GameConfig"], Any]) -> Any:
+        """Return factory(self), computed on first use and kept on this config under key."""
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = factory(self)
+            return value
 
 
 def build_game_config(era_cfg: Mapping[str, Any]) -> GameConfig:
     if not isinstance(era_cfg, Mapping):
         raise TypeError(f"build_game_config expected Mapping, got {type(era_cfg).__name__}")
-    cfg_copy = copy.deepcopy(era_cfg)
-    frozen = _freeze_mapping(cfg_copy)
+    # _freeze_mapping rebuilds every mapping/list, so the era dict (whose nested blocks
+    # may be shared with era.DEFAULT_ERA / the era cache) needs no defensive deepcopy.
+    frozen = _freeze_mapping(era_cfg)
     return GameConfig(
         era=frozen,
         knobs=_as_mapping(frozen.get("knobs", {})),
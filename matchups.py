@@ -176,13 +176,24 @@ def build_matchups(
     best_key: Optional[Tuple[str, ...]] = None
     best_assign: Optional[Dict[str, str]] = None
 
-    # Iterate all remaining defender permutations (<= 120).
-    for perm in permutations(remaining_def):
+    # _pair_score is pure, so score each (remaining off, remaining def) pair once (<= 25)
+    # and let the permutation loop index the table instead of re-scoring 5 x 120 pairs.
+    pair_rows = [[_pair_score(opid, dpid) for dpid in remaining_def] for opid in remaining_off]
+    n_remaining = len(remaining_off)
+
+    # Iterate all remaining defender permutations (<= 120), by position in remaining_def
+    # (same order as permuting the pids). Totals accumulate in the same order as before.
+    for perm in permutations(range(n_remaining)):
         total = fixed_score
+        for i in range(n_remaining):
+            total += pair_rows[i][perm[i]]
+
+        # Mapping/key are only needed for a new best or a tie.
+        if not (total > best_score + 1e-9 or abs(total - best_score) <= 1e-9):
+            continue
         mapping: Dict[str, str] = {opid: dpid for opid, dpid in fixed_pairs}
-        for opid, dpid in zip(remaining_off, perm):
-            mapping[opid] = dpid
-            total += _pair_score(opid, dpid)
+        for opid, j in zip(remaining_off, perm):
+            mapping[opid] = remaining_def[j]
 
         # Deterministic tie-break: lexicographic defender tuple in off_pids order.
         key = tuple(mapping.get(opid, "") for opid in off_pids)
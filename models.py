@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
+import sys
 import warnings
 
-from .core import clamp
-
 
 # ---------------------------------------------------------------------------
 # Fatigue scaling (Issue #9)
@@ -75,19 +75,10 @@ def _fatigue_profile_for_key(key: str):
     return FATIGUE_PROFILE_BASE
 
 
-def _fatigue_scale(key: str, energy: float) -> float:
-    """
-    energy(0..1)에 따른 스탯 배율(0..1)을 계산한다.
-    9-A(비선형) + 9-B(스탯별 차등)
-    """
-    e = clamp(float(energy), 0.0, 1.0)
-    prof = _fatigue_profile_for_key(key)
+def _compile_fatigue_profile(prof: Dict[str, float]) -> tuple:
+    """프로필 dict -> (floor, gamma, crit_e, floor_min, crit_pow) float 튜플 (기본값/안전장치 포함)."""
     floor = float(prof.get("floor", 0.78))
     gamma = float(prof.get("gamma", 1.9))
-
-    # Red-zone dynamic floor:
-    # - energy < crit_e 구간에서만 floor가 floor_min 방향으로 추가 하락
-    # - crit_pow로 레드존 가속 정도를 조절
     crit_e = float(prof.get("crit_e", 0.0))
     floor_min = float(prof.get("floor_min", floor))
     crit_pow = float(prof.get("crit_pow", 1.0))
@@ -95,7 +86,32 @@ def _fatigue_scale(key: str, energy: float) -> float:
     # safety: floor_min cannot exceed floor
     if floor_min > floor:
         floor_min = floor
+    return (floor, gamma, crit_e, floor_min, crit_pow)
+
+
+# key -> compiled profile tuple.
+# Player.get()은 포제션당 수백 번 호출되므로, 키 분류(prefix 매칭)와 dict 조회/float 변환을
+# 키마다 한 번만 수행한다. (derived 키 집합은 유한하므로 캐시 크기도 유한)
+@lru_cache(maxsize=None)
+def _fatigue_params_for_key(key: str) -> tuple:
+    return _compile_fatigue_profile(_fatigue_profile_for_key(key))
+
+
+def _fatigue_scale(key: str, energy: float) -> float:
+    """
+    energy(0..1)에 따른 스탯 배율(0..1)을 계산한다.
+    9-A(비선형) + 9-B(스탯별 차등)
+    """
+    e = float(energy)
+    if e < 0.0:
+        e = 0.0
+    elif e > 1.0:
+        e = 1.0
+    floor, gamma, crit_e, floor_min, crit_pow = _fatigue_params_for_key(key)
 
+    # Red-zone dynamic floor:
+    # - energy < crit_e 구간에서만 floor가 floor_min 방향으로 추가 하락
+    # - crit_pow로 레드존 가속 정도를 조절
     floor_eff = floor
     if crit_e > 1e-9 and e < crit_e:
         t = (crit_e - e) / crit_e  # 0 at crit_e, 1 at 0
@@ -103,13 +119,39 @@ def _fatigue_scale(key: str, energy: float) -> float:
 
     # nonlinear curve: floor_eff + (1-floor_eff) * (energy^gamma)
     scale = floor_eff + (1.0 - floor_eff) * (e ** gamma)
-    return clamp(scale, 0.0, 1.0)
+    if scale < 0.0:
+        return 0.0
+    if scale > 1.0:
+        return 1.0
+    return scale
+
+
+def _intern_str(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
 
 
 def _default_possession_end_counts() -> Dict[str, int]:
     return {"FGA": 0, "TOV": 0, "FT_TRIP": 0, "OTHER": 0}
 
 
+# Tracked per-player boxscore keys (other modules may read raw `player_stats` directly).
+PLAYER_STAT_KEYS = (
+    "PTS",
+    "FGM", "FGA",
+    "3PM", "3PA",
+    "FTM", "FTA",
+    "ORB", "DRB",
+    "AST",
+    "STL",
+    "BLK",
+    "TOV",
+)
+
+
+def new_player_stat_line() -> Dict[str, int]:
+    return dict.fromkeys(PLAYER_STAT_KEYS, 0)
+
+
 def _default_shot_zone_detail() -> Dict[str, Dict[str, int]]:
     zones = ["Restricted_Area", "Paint_Non_RA", "Mid_Range", "Corner_3", "ATB_3"]
     return {z: {"FGA": 0, "FGM": 0, "AST_FGM": 0} for z in zones}
@@ -198,13 +240,18 @@ class Player:
     derived: Dict[str, float] = field(default_factory=dict)
     energy: float = 1.0  # 1.0 fresh -> 0.0 exhausted  (단일 스케일과 동일한 의미)
 
+    def __post_init__(self) -> None:
+        # pid is used as a dict key everywhere (player_stats, fatigue, minutes, roles).
+        if type(self.pid) is str:
+            self.pid = sys.intern(self.pid)
+
     def get(self, key: str, fatigue_sensitive: bool = True) -> float:
         v = float(self.derived.get(key, DERIVED_DEFAULT))
         if not fatigue_sensitive:
             return v
 
         # 더 강한 비선형 피로 + 스탯별 민감도 차등
-        return v * _fatigue_scale(key, getattr(self, "energy", 1.0))
+        return v * _fatigue_scale(key, self.energy)
 
 @dataclass
 class TeamState:
@@ -221,6 +268,15 @@ class TeamState:
         if not str(self.team_id).strip():
             raise ValueError("TeamState.team_id is empty")
 
+        # Intern role names / pids into a new dict (the caller's mapping is left untouched).
+        if type(self.roles) is dict and self.roles:
+            self.roles = {_intern_str(role): _intern_str(pid) for role, pid in self.roles.items()}
+
+        # Pre-allocate a box line per rostered player (stable key set; see add_player_stat).
+        for p in self.lineup:
+            if p.pid not in self.player_stats:
+                self.player_stats[p.pid] = new_player_stat_line()
+
 
     # -------------------------
     # Rotation (user-configurable)
@@ -271,11 +327,40 @@ class TeamState:
     role_fit_bad_totals: Dict[str, int] = field(default_factory=dict)  # {'TO': n, 'RESET': n}
     role_fit_bad_by_grade: Dict[str, Dict[str, int]] = field(default_factory=dict)  # grade -> {'TO': n, 'RESET': n}
 
+    # pid -> lineup index for find_player() (derived from lineup; rebuilt lazily when stale)
+    _by_pid: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _by_pid_src: Any = field(default=None, init=False, repr=False, compare=False)
+    # (pid, role) -> role_fit_score memo; cleared at the start of every simulate_possession
+    # call (energy, and so fatigue-sensitive ratings, only change between those calls).
+    _role_fit_cache: Dict[Tuple[str, str], float] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Other possession-scoped derived values (on-court rating means etc.); same lifetime.
+    _possession_cache: Dict[Any, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def clear_possession_caches(self) -> None:
+        """Drop values derived from the current on-court group / energy (see simulate_possession)."""
+        self._role_fit_cache.clear()
+        self._possession_cache.clear()
+
+    def _rebuild_pid_index(self) -> Dict[str, int]:
+        by_pid: Dict[str, int] = {}
+        for idx, p in enumerate(self.lineup):
+            # keep first occurrence (matches the old linear-scan semantics)
+            by_pid.setdefault(p.pid, idx)
+        self._by_pid = by_pid
+        self._by_pid_src = (id(self.lineup), len(self.lineup))
+        return by_pid
+
     def find_player(self, pid: str) -> Optional[Player]:
-        for p in self.lineup:
-            if p.pid == pid:
-                return p
-        return None
+        lineup = self.lineup
+        by_pid = self._by_pid
+        if self._by_pid_src != (id(lineup), len(lineup)):
+            by_pid = self._rebuild_pid_index()
+        idx = by_pid.get(pid)
+        if idx is not None and idx < len(lineup) and lineup[idx].pid == pid:
+            return lineup[idx]
+        # Miss or stale entry (lineup slot replaced in place): rebuild once and retry.
+        idx = self._rebuild_pid_index().get(pid)
+        return lineup[idx] if idx is not None else None
 
     def get_player(self, pid: str) -> Optional[Player]:
         """Backward-compatible alias for find_player()."""
@@ -341,21 +426,15 @@ class TeamState:
         return pid in self.on_court_pids
 
     def add_player_stat(self, pid: str, key: str, inc: int = 1) -> None:
-        if pid not in self.player_stats:
-            # Keep a stable set of tracked boxscore keys for every player.
-            # (Other modules may read raw `player_stats` directly.)
-            self.player_stats[pid] = {
-                "PTS": 0,
-                "FGM": 0, "FGA": 0,
-                "3PM": 0, "3PA": 0,
-                "FTM": 0, "FTA": 0,
-                "ORB": 0, "DRB": 0,
-                "AST": 0,
-                "STL": 0,
-                "BLK": 0,
-                "TOV": 0,
-            }
-        self.player_stats[pid][key] = self.player_stats[pid].get(key, 0) + inc
+        # Box lines are pre-allocated for every lineup pid (__post_init__ / init_player_boxes),
+        # so the hot path is a plain increment.
+        try:
+            self.player_stats[pid][key] += inc
+        except KeyError:
+            line = self.player_stats.get(pid)
+            if line is None:
+                line = self.player_stats[pid] = new_player_stat_line()
+            line[key] = line.get(key, 0) + inc
 
     def get_role_player(self, role: str, fallback_rank_key: Optional[str] = None) -> Player:
         pid = self.roles.get(role)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import heapq
 import random
+from operator import methodcaller
 from typing import Dict, List, Optional, Sequence, Tuple
 
-from ..core import weighted_choice
+from ..core import weighted_choice_index
 from ..models import Player, TeamState
 
 def _clamp(x: float, lo: float, hi: float) -> float:
@@ -20,15 +22,11 @@ def choose_weighted_player(
     # Weighted random choice among provided candidates.
     # NOTE: callers should pass de-duplicated players.
     extra_mult_by_pid = extra_mult_by_pid or {}
-    weights = {
-        p.pid: (max(p.get(key), 1.0) ** power) * float(extra_mult_by_pid.get(p.pid, 1.0))
+    weights = [
+        (max(p.get(key), 1.0) ** power) * float(extra_mult_by_pid.get(p.pid, 1.0))
         for p in players
-    }
-    pid = weighted_choice(rng, weights)
-    for p in players:
-        if p.pid == pid:
-            return p
-    return players[0]
+    ]
+    return players[weighted_choice_index(rng, weights)]
 
 
 def _shot_diet_info(style: Optional[object]) -> Dict[str, object]:
@@ -90,16 +88,13 @@ def _players_from_roles(team: TeamState, role_priority: Sequence[str]) -> List[P
 
 
 def _top_k_by_stat(team: TeamState, stat_key: str, k: int, exclude_pids: Optional[set] = None) -> List[Player]:
-    exclude_pids = exclude_pids or set()
-    sorted_p = sorted(_active(team), key=lambda p: p.get(stat_key), reverse=True)
-    out: List[Player] = []
-    for p in sorted_p:
-        if p.pid in exclude_pids:
-            continue
-        out.append(p)
-        if len(out) >= k:
-            break
-    return out
+    # Filter first, then partial-select: excluded players are never rated, and nlargest
+    # keeps sorted(..., reverse=True)[:k] order (ties stay in on-court order). At least
+    # one player is returned when any is eligible, as before.
+    active = _active(team)
+    if exclude_pids:
+        active = [p for p in active if p.pid not in exclude_pids]
+    return heapq.nlargest(max(int(k), 1), active, key=methodcaller("get", stat_key))
 
 
 def _fill_candidates_with_top_k(
@@ -3,7 +3,7 @@ from __future__ import annotations
 import random
 from typing import Dict, List, Optional, Sequence, Tuple
 
-from ..core import weighted_choice
+from ..core import weighted_choice_index
 from ..models import Player, TeamState
 
 from .participants_roles import (
@@ -39,17 +39,13 @@ def choose_shooter_for_three(rng: random.Random, offense: TeamState, style: Opti
     cand = _active(offense)
     info = _shot_diet_info(style)
     apply_bias = style is not None
-    weights: Dict[str, float] = {}
+    weights: List[float] = []
     for p in cand:
         mult = 1.0
         if apply_bias:
             mult = 0.85 if p.pid in (info.get("primary_pid"), info.get("secondary_pid")) else 1.10
-        weights[p.pid] = (max(p.get("SHOT_3_CS"), 1.0) ** 1.35) * mult
-    pid = weighted_choice(rng, weights)
-    for p in cand:
-        if p.pid == pid:
-            return p
-    return cand[0]
+        weights.append((max(p.get("SHOT_3_CS"), 1.0) ** 1.35) * mult)
+    return cand[weighted_choice_index(rng, weights)]
 
 
 def choose_shooter_for_mid(rng: random.Random, offense: TeamState, style: Optional[object] = None) -> Player:
@@ -57,17 +53,13 @@ def choose_shooter_for_mid(rng: random.Random, offense: TeamState, style: Option
     cand = _active(offense)
     info = _shot_diet_info(style)
     apply_bias = style is not None
-    weights: Dict[str, float] = {}
+    weights: List[float] = []
     for p in cand:
         mult = 1.0
         if apply_bias:
             mult = 0.85 if p.pid in (info.get("primary_pid"), info.get("secondary_pid")) else 1.10
-        weights[p.pid] = (max(p.get("SHOT_MID_CS"), 1.0) ** 1.25) * mult
-    pid = weighted_choice(rng, weights)
-    for p in cand:
-        if p.pid == pid:
-            return p
-    return cand[0]
+        weights.append((max(p.get("SHOT_MID_CS"), 1.0) ** 1.25) * mult)
+    return cand[weighted_choice_index(rng, weights)]
 
 
 # ---- Creator selection (pull-up / off-dribble) ----
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import random
+from operator import methodcaller
 from typing import Dict, List, Optional, Sequence, Tuple
 
 from ..models import Player, TeamState
@@ -31,6 +32,9 @@ from .participants_common import (
     choose_weighted_player,
 )
 
+# max() key for the passing fallbacks; methodcaller avoids a lambda frame per player.
+_BY_PASS_CREATE = methodcaller("get", "PASS_CREATE")
+
 def _role_of_pid(team: TeamState, pid: str) -> str:
     pid = str(pid or "")
     if not pid:
@@ -251,7 +255,7 @@ def choose_passer(rng: random.Random, offense: TeamState, base_action: str, outc
     cand = _unique_players(cand)[:cap]
     if not cand:
         # Safety fallback
-        return max(_active(offense), key=lambda p: p.get("PASS_CREATE"))
+        return max(_active(offense), key=_BY_PASS_CREATE)
 
     key, power = _PASSER_KEY_POWER.get(fam, ("PASS_CREATE", 1.10))
     role_mult_map = _PASSER_ROLE_MULT.get(fam, _PASSER_ROLE_MULT["default"])
@@ -301,7 +305,7 @@ def choose_assister_deterministic(team: TeamState, shooter_pid: str) -> Optional
     others = [p for p in _active(team) if p.pid != shooter_pid]
     if not others:
         return None
-    return max(others, key=lambda x: x.get("PASS_CREATE"))
+    return max(others, key=_BY_PASS_CREATE)
 
 
 # ---- Assister selection (weighted; for implied assists) ----
@@ -462,4 +466,4 @@ def choose_default_actor(offense: TeamState) -> Player:
             if p is not None and offense.is_on_court(p.pid):
                 return p
     # Final fallback: best creator/passer on the floor
-    return max(_active(offense), key=lambda p: p.get("PASS_CREATE"))
+    return max(_active(offense), key=_BY_PASS_CREATE)
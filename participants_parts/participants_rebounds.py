@@ -4,7 +4,7 @@ import math
 import random
 from typing import Dict, List, Optional
 
-from ..core import weighted_choice
+from ..core import weighted_choice_index
 from ..models import Player, TeamState
 
 from .participants_common import _active, _clamp
@@ -29,12 +29,8 @@ def _softmax_pick_player(
     mix = _clamp(float(mix), 0.0, 1.0)
     m = max(scores)
     base = 1.0 - mix
-    weights = {p.pid: (base + mix * math.exp(beta * (float(s) - m))) for p, s in zip(players, scores)}
-    pid = weighted_choice(rng, weights)
-    for p in players:
-        if p.pid == pid:
-            return p
-    return players[0]
+    weights = [(base + mix * math.exp(beta * (float(s) - m))) for s in scores]
+    return players[weighted_choice_index(rng, weights)]
 
 
 # Rebound softmax expects a stable score scale. We normalize the raw rebound score
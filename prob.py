@@ -3,9 +3,10 @@ from __future__ import annotations
 import math
 import random
 from collections.abc import Mapping
-from typing import Dict, Optional, TYPE_CHECKING
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
 
-from .core import clamp, sigmoid
+from .core import clamp, sigmoid_lut
+from .game_config import is_mapping
 from .era import (
     DEFAULT_LOGISTIC_PARAMS,
     DEFAULT_PROB_MODEL,
@@ -19,6 +20,79 @@ if TYPE_CHECKING:
 # Probability model
 # -------------------------
 
+class _ProbSnap:
+    """Per-GameConfig constants for prob_from_scores.
+
+    prob_model/logistic_params/variance_params are frozen inside GameConfig, so the float
+    coercions and era/default fallbacks only need resolving once per config. Per-kind
+    entries (sensitivity, noise std * kind_mult) are filled lazily on first use.
+    """
+
+    __slots__ = ("pm", "lp", "vp", "base_p_min", "base_p_max", "prob_min", "prob_max", "use_lut", "team_lo", "team_hi", "by_kind", "logits")
+
+    def __init__(self, game_cfg: "GameConfig"):
+        pm = game_cfg.prob_model if is_mapping(game_cfg.prob_model) else DEFAULT_PROB_MODEL
+        lp = game_cfg.logistic_params if is_mapping(game_cfg.logistic_params) else DEFAULT_LOGISTIC_PARAMS
+        vp = game_cfg.variance_params if is_mapping(game_cfg.variance_params) else DEFAULT_VARIANCE_PARAMS
+        self.pm = pm
+        self.lp = lp
+        self.vp = vp
+        self.base_p_min = float(pm.get("base_p_min", 0.02))
+        self.base_p_max = float(pm.get("base_p_max", 0.98))
+        self.prob_min = float(pm.get("prob_min", 0.03))
+        self.prob_max = float(pm.get("prob_max", 0.97))
+        self.use_lut = bool(pm.get("sigmoid_lut"))
+        # team volatility multiplier (clamped)
+        tlo, thi = 0.70, 1.40
+        if isinstance(vp.get("team_mult_lo"), (int, float)):
+            tlo = float(vp["team_mult_lo"])
+        if isinstance(vp.get("team_mult_hi"), (int, float)):
+            thi = float(vp["team_mult_hi"])
+        self.team_lo = tlo
+        self.team_hi = thi
+        self.by_kind: Dict[str, Tuple[float, float]] = {}
+        # base_p comes from shot_base/pass_base_success entries times era knobs, i.e. a
+        # small discrete set per config, so logit(base_p) is memoized by value.
+        self.logits: Dict[float, float] = {}
+
+    def kind_params(self, kind: str) -> Tuple[float, float]:
+        """(sensitivity, logit noise std * kind_mult) for an outcome kind."""
+        pm, lp, vp = self.pm, self.lp, self.vp
+
+        # ---- sensitivity (2-1, 2-2) ----
+        spec = lp.get(kind) or lp.get("default") or {}
+        sens = spec.get("sensitivity")
+        scale = spec.get("scale")
+
+        # Back-compat fallback (older era json without logistic_params)
+        if sens is None:
+            if scale is not None and float(scale) > 1e-9:
+                sens = 1.0 / float(scale)
+            else:
+                # old single-scale knobs
+                if kind.startswith("pass"):
+                    sens = 1.0 / float(pm.get("pass_scale", 20.0))
+                elif kind.startswith("rebound"):
+                    sens = 1.0 / float(pm.get("rebound_scale", 22.0))
+                else:
+                    sens = 1.0 / float(pm.get("shot_scale", 18.0))
+
+        # ---- variance knob (2-3) ----
+        std = float(vp.get("logit_noise_std", 0.0))
+        kind_mult = float((vp.get("kind_mult") or {}).get(kind, 1.0)) if isinstance(vp.get("kind_mult"), Mapping) else 1.0
+
+        params = (float(sens), std * kind_mult)
+        self.by_kind[kind] = params
+        return params
+
+
+_LOGIT_CACHE_MAX = 256
+
+
+def _prob_snap(game_cfg: "GameConfig") -> _ProbSnap:
+    return game_cfg.derived("prob_snap", _ProbSnap)
+
+
 def prob_from_scores(
     rng: Optional[random.Random],
     base_p: float,
@@ -42,50 +116,50 @@ def prob_from_scores(
     """
     if game_cfg is None:
         raise ValueError("prob_from_scores requires game_cfg")
-    pm = game_cfg.prob_model if isinstance(game_cfg.prob_model, Mapping) else DEFAULT_PROB_MODEL
-    base_p = clamp(float(base_p), float(pm.get("base_p_min", 0.02)), float(pm.get("base_p_max", 0.98)))
-    base_logit = math.log(base_p / (1.0 - base_p))
-
-    # ---- sensitivity (2-1, 2-2) ----
-    lp = game_cfg.logistic_params if isinstance(game_cfg.logistic_params, Mapping) else DEFAULT_LOGISTIC_PARAMS
-    spec = lp.get(kind) or lp.get("default") or {}
-    sens = spec.get("sensitivity")
-    scale = spec.get("scale")
-
-    # Back-compat fallback (older era json without logistic_params)
-    if sens is None:
-        if scale is not None and float(scale) > 1e-9:
-            sens = 1.0 / float(scale)
-        else:
-            # old single-scale knobs
-            if kind.startswith("pass"):
-                sens = 1.0 / float(pm.get("pass_scale", 20.0))
-            elif kind.startswith("rebound"):
-                sens = 1.0 / float(pm.get("rebound_scale", 22.0))
-            else:
-                sens = 1.0 / float(pm.get("shot_scale", 18.0))
+    snap = _prob_snap(game_cfg)
+    base_p = clamp(float(base_p), snap.base_p_min, snap.base_p_max)
+    base_logit = snap.logits.get(base_p)
+    if base_logit is None:
+        base_logit = math.log(base_p / (1.0 - base_p))
+        if len(snap.logits) < _LOGIT_CACHE_MAX:
+            snap.logits[base_p] = base_logit
+
+    params = snap.by_kind.get(kind)
+    if params is None:
+        params = snap.kind_params(kind)
+    sens, kind_std = params
 
-    gap = (float(off_score) - float(def_score)) * float(sens)
+    gap = (float(off_score) - float(def_score)) * sens
 
-    # ---- variance knob (2-3) ----
     noise = 0.0
     if rng is not None:
-        vp = game_cfg.variance_params if isinstance(game_cfg.variance_params, Mapping) else DEFAULT_VARIANCE_PARAMS
-        std = float(vp.get("logit_noise_std", 0.0))
-        kind_mult = float((vp.get("kind_mult") or {}).get(kind, 1.0)) if isinstance(vp.get("kind_mult"), Mapping) else 1.0
-        # team volatility multiplier (clamped)
-        tlo, thi = 0.70, 1.40
-        if isinstance(vp.get("team_mult_lo"), (int, float)):
-            tlo = float(vp["team_mult_lo"])
-        if isinstance(vp.get("team_mult_hi"), (int, float)):
-            thi = float(vp["team_mult_hi"])
-        vm = clamp(float(variance_mult), tlo, thi)
-        std = std * kind_mult * vm
+        vm = clamp(float(variance_mult), snap.team_lo, snap.team_hi)
+        std = kind_std * vm
         if std > 1e-9:
             noise = rng.gauss(0.0, std)
 
-    p = sigmoid(base_logit + gap + noise + float(logit_delta) + float(fatigue_logit_delta))
-    return clamp(p, float(pm.get("prob_min", 0.03)), float(pm.get("prob_max", 0.97)))
+    return _prob_from_logit(
+        base_logit + gap + noise + float(logit_delta) + float(fatigue_logit_delta),
+        snap.prob_min,
+        snap.prob_max,
+        snap.use_lut,
+    )
+
+
+def _prob_from_logit(x: float, prob_min: float, prob_max: float, use_lut: bool = False) -> float:
+    """Numeric core of prob_from_scores: sigmoid(x) clamped to [prob_min, prob_max].
+
+    Scalar floats in, float out (no config/dict access). sigmoid and clamp are inlined
+    from core so the hot path is a single call; keep them in sync with core.sigmoid.
+    """
+    if use_lut:
+        p = sigmoid_lut(x)
+    elif x >= 0:
+        p = 1.0 / (1.0 + math.exp(-x))
+    else:
+        z = math.exp(x)
+        p = z / (1.0 + z)
+    return prob_min if p < prob_min else prob_max if p > prob_max else p
 
 
 def _shot_kind_from_outcome(outcome: str) -> str:
@@ -99,11 +173,9 @@ def _shot_kind_from_outcome(outcome: str) -> str:
     return "shot_rim"
 
 def _team_variance_mult(team: "TeamState", game_cfg: "GameConfig") -> float:
-    vp = game_cfg.variance_params if isinstance(game_cfg.variance_params, Mapping) else DEFAULT_VARIANCE_PARAMS
     try:
         vm = float((team.tactics.context or {}).get("VARIANCE_MULT", 1.0))
     except Exception:
         vm = 1.0
-    lo = float(vp.get("team_mult_lo", 0.70))
-    hi = float(vp.get("team_mult_hi", 1.40))
-    return clamp(vm, lo, hi)
+    snap = _prob_snap(game_cfg)
+    return clamp(vm, snap.team_lo, snap.team_hi)
@@ -15,12 +15,17 @@ Data contract (in profiles_data.py):
   - OFFENSE_SCHEME_MULT: {off_scheme: {base_action: {outcome: multiplier}}}
   - DEFENSE_SCHEME_MULT: {def_scheme: {base_action: {outcome: multiplier}}}
 
+All tables are re-exported as read-only MappingProxyType views.
+
 LLM workflow tip:
   - Provide `profiles.py` by default.
   - Only include `profiles_data.py` when you are actively tuning tables.
 """
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import Any, Mapping
+
 try:
     # Package execution
     from .profiles_data import (  # noqa: F401
@@ -48,6 +53,26 @@ except ImportError:  # pragma: no cover
         DEFENSE_SCHEME_MULT,
     )
 
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap nested dicts in read-only MappingProxyType views."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+
+# These tables are constants: freeze them so any accidental in-place edit fails loudly
+# instead of silently leaking across games (era.py thaws its own private copies).
+OUTCOME_PROFILES = _freeze(OUTCOME_PROFILES)
+SHOT_BASE = _freeze(SHOT_BASE)
+CORNER3_PROB_BY_ACTION_BASE = _freeze(CORNER3_PROB_BY_ACTION_BASE)
+PASS_BASE_SUCCESS = _freeze(PASS_BASE_SUCCESS)
+OFF_SCHEME_ACTION_WEIGHTS = _freeze(OFF_SCHEME_ACTION_WEIGHTS)
+ACTION_OUTCOME_PRIORS = _freeze(ACTION_OUTCOME_PRIORS)
+ACTION_ALIASES = _freeze(ACTION_ALIASES)
+OFFENSE_SCHEME_MULT = _freeze(OFFENSE_SCHEME_MULT)
+DEFENSE_SCHEME_MULT = _freeze(DEFENSE_SCHEME_MULT)
+
 __all__ = [
     "OUTCOME_PROFILES",
     "SHOT_BASE",
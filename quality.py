@@ -19,6 +19,7 @@ Generated on: 2025-12-25
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
 # --------------------------------------------------------------------------------------
@@ -101,6 +102,9 @@ except ImportError:  # pragma: no cover
 # Helpers
 # --------------------------------------------------------------------------------------
 
+# Inputs are tactic scheme names (a handful per game); bounded in case callers pass
+# free-form strings. Reset via caches.clear_caches().
+@lru_cache(maxsize=256)
 def canonical_scheme(scheme: str) -> str:
     """Map input scheme string into the canonical key used by the dictionaries."""
     if scheme in SCHEME_BASE_OUTCOME_LABELS:
@@ -6,10 +6,12 @@
 
 from __future__ import annotations
 
-from typing import Dict
+import sys
+from types import MappingProxyType
+from typing import Mapping
 
 # Scheme aliases: accept short english ids too.
-SCHEME_ALIASES: Dict[str, str] = {
+_SCHEME_ALIASES_SRC = {
     "drop": "drop",
     "Drop": "drop",
     "Switch_Everything": "올-스위치",
@@ -36,3 +38,9 @@ SCHEME_ALIASES: Dict[str, str] = {
     "2-3 zone": "2-3 존디펜스",
     "2-3 존디펜스": "2-3 존디펜스",
 }
+
+# Read-only with interned keys/canonical names: the table is fixed at import, and interned
+# canonical names let downstream scheme-keyed lookups hit on identity.
+SCHEME_ALIASES: Mapping[str, str] = MappingProxyType(
+    {sys.intern(k): sys.intern(v) for k, v in _SCHEME_ALIASES_SRC.items()}
+)
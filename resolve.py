@@ -34,6 +34,38 @@ def is_to(o: str) -> bool: return str(o).startswith("TO_")
 def is_foul(o: str) -> bool: return str(o).startswith("FOUL_")
 def is_reset(o: str) -> bool: return str(o).startswith("RESET_")
 
+# Integer outcome groups. The outcome vocabulary is a small fixed set of strings (era priors),
+# so each one is classified once and resolve_outcome dispatches on the cached code.
+OUTCOME_SHOT, OUTCOME_PASS, OUTCOME_TO, OUTCOME_FOUL, OUTCOME_RESET, OUTCOME_OTHER = range(6)
+_OUTCOME_GROUP: Dict[str, int] = {}
+
+
+def outcome_group(o: str) -> int:
+    g = _OUTCOME_GROUP.get(o)
+    if g is None:
+        if is_shot(o):
+            g = OUTCOME_SHOT
+        elif is_pass(o):
+            g = OUTCOME_PASS
+        elif is_to(o):
+            g = OUTCOME_TO
+        elif is_foul(o):
+            g = OUTCOME_FOUL
+        elif is_reset(o):
+            g = OUTCOME_RESET
+        else:
+            g = OUTCOME_OTHER
+        _OUTCOME_GROUP[o] = g
+    return g
+
+
+_GROUP_HANDLERS = {
+    OUTCOME_SHOT: handle_shot,
+    OUTCOME_PASS: handle_pass,
+    OUTCOME_TO: handle_turnover,
+    OUTCOME_FOUL: handle_foul,
+}
+
 
 # -------------------------
 # Resolve sampled outcome into events
@@ -121,11 +153,12 @@ def resolve_outcome(
     try:
         if bool(tags.get("role_fit_applied", False)):
             g = str(tags.get("role_fit_grade", "B"))
-            if is_to(outcome):
+            group = outcome_group(outcome)
+            if group == OUTCOME_TO:
                 offense.role_fit_bad_totals["TO"] = offense.role_fit_bad_totals.get("TO", 0) + 1
                 offense.role_fit_bad_by_grade.setdefault(g, {}).setdefault("TO", 0)
                 offense.role_fit_bad_by_grade[g]["TO"] += 1
-            elif is_reset(outcome):
+            elif group == OUTCOME_RESET:
                 offense.role_fit_bad_totals["RESET"] = offense.role_fit_bad_totals.get("RESET", 0) + 1
                 offense.role_fit_bad_by_grade.setdefault(g, {}).setdefault("RESET", 0)
                 offense.role_fit_bad_by_grade[g]["RESET"] += 1
@@ -178,19 +211,10 @@ def resolve_outcome(
         payload["double_label"] = double_label
         return payload
 
-    # resolve by type
-    if is_shot(outcome):
-        return handle_shot(rc, _with_matchup, _record_exception)
-    if is_pass(outcome):
-        return handle_pass(rc, _with_matchup, _record_exception)
-    if is_to(outcome):
-        return handle_turnover(rc, _with_matchup, _record_exception)
-    if is_foul(outcome):
-        return handle_foul(rc, _with_matchup, _record_exception)
-
-    if is_reset(outcome):
-        clear_pass_tracking(ctx)
-        return "RESET", _with_matchup({"outcome": outcome})
+    # resolve by type (RESET_* and unknown outcomes both end as a plain reset)
+    handler = _GROUP_HANDLERS.get(outcome_group(outcome))
+    if handler is not None:
+        return handler(rc, _with_matchup, _record_exception)
 
     clear_pass_tracking(ctx)
     return "RESET", _with_matchup({"outcome": outcome})
@@ -6,7 +6,8 @@ from collections.abc import Mapping
 from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
 
 from ..builders import get_action_base
-from ..core import clamp, dot_profile
+from ..core import clamp
+from ..game_config import is_mapping
 from ..defense import team_def_snapshot
 from ..era import DEFAULT_PROB_MODEL
 from ..models import GameState, Player, TeamState
@@ -42,7 +43,7 @@ def _pick_default_actor(offense: TeamState) -> Player:
     return choose_default_actor(offense)
 
 def _knob_mult(game_cfg: "GameConfig", key: str, default: float = 1.0) -> float:
-    knobs = game_cfg.knobs if isinstance(game_cfg.knobs, Mapping) else {}
+    knobs = game_cfg.knobs if is_mapping(game_cfg.knobs) else {}
     try:
         return float(knobs.get(key, default))
     except Exception:
@@ -88,6 +89,39 @@ class ResolveContext:
     fatigue_logit_delta: float
     carry_in: float
 
+# outcome -> ((offense (key, weight) terms), (defense (key, weight) terms)).
+# OUTCOME_PROFILES is a frozen constant table, so each profile is flattened once and the
+# score loops below read player/defense values straight into the dot product (no per-step
+# intermediate {key: value} dicts or dot_profile() .get() calls).
+_PROFILE_TERMS: Dict[str, Tuple[Tuple[Tuple[str, float], ...], Tuple[Tuple[str, float], ...]]] = {}
+
+
+def _profile_terms(outcome: str, prof: Mapping[str, Any]):
+    terms = _PROFILE_TERMS.get(outcome)
+    if terms is None:
+        terms = (
+            tuple((k, float(w)) for k, w in prof["offense"].items()),
+            tuple((k, float(w)) for k, w in prof["defense"].items()),
+        )
+        _PROFILE_TERMS[outcome] = terms
+    return terms
+
+
+def _possession_def_snapshot(defense: TeamState) -> Dict[str, float]:
+    """team_def_snapshot memoized for the current possession (read-only for callers).
+
+    Keyed to the on_court_pids list like the other possession-cache entries, since dead-ball
+    substitutions can run inside a simulate_possession call.
+    """
+    cache = defense._possession_cache
+    hit = cache.get("def_snapshot")
+    if hit is not None and hit[0] is defense.on_court_pids:
+        return hit[1]
+    snap = team_def_snapshot(defense)
+    cache["def_snapshot"] = (defense.on_court_pids, snap)
+    return snap
+
+
 def build_resolve_context(
     rng: random.Random,
     outcome: str,
@@ -108,13 +142,13 @@ def build_resolve_context(
     # Prob model / tuning knobs (ctx can override per-run)
     pm = ctx.get("prob_model")
     if not isinstance(pm, Mapping):
-        pm = game_cfg.prob_model if isinstance(game_cfg.prob_model, Mapping) else DEFAULT_PROB_MODEL
+        pm = game_cfg.prob_model if is_mapping(game_cfg.prob_model) else DEFAULT_PROB_MODEL
 
     # shot_diet participant bias (optional)
     style = ctx.get("shot_diet_style")
 
     base_action = get_action_base(action, game_cfg)
-    def_snap = team_def_snapshot(defense)
+    def_snap = _possession_def_snapshot(defense)
     prof = OUTCOME_PROFILES.get(outcome)
     if not prof:
         clear_pass_tracking(ctx)
@@ -264,8 +298,10 @@ def build_resolve_context(
     variance_mult = _team_variance_mult(offense, game_cfg) * float(ctx.get("variance_mult", 1.0))
 
     # compute scores
-    off_vals = {k: actor.get(k) for k in prof["offense"].keys()}
-    off_score = dot_profile(off_vals, prof["offense"])
+    off_terms, def_terms = _profile_terms(outcome, prof)
+    off_score = 0.0
+    for k, w in off_terms:
+        off_score += actor.get(k) * w
     # Blend team defense snapshot with the primary defender stats (per-key weights).
     blend = ctx.get("matchup_def_blend", {}) or {}
     if not isinstance(blend, Mapping):
@@ -281,17 +317,18 @@ def build_resolve_context(
         _record_exception("matchup_defender_lookup", e)
         defender_player = None
 
-    def_vals = {}
-    for k in prof["defense"].keys():
+    def_score = 0.0
+    has_defender = defender_player is not None
+    blend_get = blend.get
+    for k, pw in def_terms:
         t_val = float(def_snap.get(k, 50.0))
-        d_val = float(engine_get_stat(defender_player, k, 50.0)) if defender_player is not None else 50.0
+        d_val = float(engine_get_stat(defender_player, k, 50.0)) if has_defender else 50.0
         try:
-            w = float(blend.get(k, 0.5))
+            w = float(blend_get(k, 0.5))
         except Exception:
             w = 0.5
-        w = clamp(w, 0.0, 1.0)
-        def_vals[k] = (w * d_val) + ((1.0 - w) * t_val)
-    def_score = dot_profile(def_vals, prof["defense"])
+        w = 0.0 if w < 0.0 else 1.0 if w > 1.0 else w
+        def_score += ((w * d_val) + ((1.0 - w) * t_val)) * pw
 
     fatigue_map = ctx.get("fatigue_map", {}) or {}
     fatigue_logit_max = float(ctx.get("fatigue_logit_max", -0.25))
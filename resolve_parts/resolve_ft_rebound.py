@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import random
-from collections.abc import Mapping
-from typing import Any, Dict, TYPE_CHECKING
+from typing import Any, Dict, Tuple, TYPE_CHECKING
 
 from ..core import clamp
+from ..game_config import is_mapping
 from ..era import DEFAULT_PROB_MODEL
 from ..models import Player, TeamState
 from ..participants import (
@@ -17,6 +17,21 @@ from .resolve_context import _knob_mult
 if TYPE_CHECKING:
     from ..game_config import GameConfig
 
+def _ft_params(game_cfg: "GameConfig") -> Tuple[float, float, float, float]:
+    """(ft_base, ft_range, ft_min, ft_max); constant for a GameConfig."""
+    return game_cfg.derived("ft_params", _compute_ft_params)
+
+
+def _compute_ft_params(game_cfg: "GameConfig") -> Tuple[float, float, float, float]:
+    pm = game_cfg.prob_model if is_mapping(game_cfg.prob_model) else DEFAULT_PROB_MODEL
+    return (
+        float(pm.get("ft_base", 0.45)),
+        float(pm.get("ft_range", 0.47)),
+        float(pm.get("ft_min", 0.40)),
+        float(pm.get("ft_max", 0.95)),
+    )
+
+
 def resolve_free_throws(
     rng: random.Random,
     shooter: Player,
@@ -24,30 +39,57 @@ def resolve_free_throws(
     team: TeamState,
     game_cfg: "GameConfig",
 ) -> Dict[str, Any]:
-    pm = game_cfg.prob_model if isinstance(game_cfg.prob_model, Mapping) else DEFAULT_PROB_MODEL
+    ft_base, ft_range, ft_min, ft_max = _ft_params(game_cfg)
     ft = shooter.get("SHOT_FT")
-    p = clamp(
-        float(pm.get("ft_base", 0.45)) + (ft / 100.0) * float(pm.get("ft_range", 0.47)),
-        float(pm.get("ft_min", 0.40)),
-        float(pm.get("ft_max", 0.95)),
-    )
-    fta = 0
+    p = clamp(ft_base + (ft / 100.0) * ft_range, ft_min, ft_max)
+    fta = max(int(n), 0)
     ftm = 0
     last_made = False
-    for _ in range(int(n)):
-        team.fta += 1
-        team.add_player_stat(shooter.pid, "FTA", 1)
-        fta += 1
-        made = rng.random() < p
-        last_made = bool(made)
-        if made:
-            team.ftm += 1
-            team.pts += 1
-            team.add_player_stat(shooter.pid, "FTM", 1)
-            team.add_player_stat(shooter.pid, "PTS", 1)
+    # One draw per attempt from the caller's Random stream (same sequence as before); the
+    # box score is then updated once per stat instead of once per attempt.
+    rng_random = rng.random
+    for _ in range(fta):
+        last_made = rng_random() < p
+        if last_made:
             ftm += 1
+    if fta:
+        pid = shooter.pid
+        team.fta += fta
+        team.add_player_stat(pid, "FTA", fta)
+        if ftm:
+            team.ftm += ftm
+            team.pts += ftm
+            team.add_player_stat(pid, "FTM", ftm)
+            team.add_player_stat(pid, "PTS", ftm)
     return {"fta": fta, "ftm": ftm, "last_made": last_made, "p_ft": float(p)}
 
+def _on_court_mean(team: TeamState, key: str) -> float:
+    """Mean on-court rating for key, memoized for the current possession (misses can repeat after ORBs).
+
+    Dead-ball substitutions can run inside a possession; set_on_court always installs a new
+    on_court_pids list, so entries are tied to the list they were computed from.
+    """
+    cache = team._possession_cache
+    ck = ("on_court_mean", key)
+    hit = cache.get(ck)
+    if hit is not None and hit[0] is team.on_court_pids:
+        return hit[1]
+    players = team.on_court_players()
+    v = sum(p.get(key) for p in players) / max(len(players), 1)
+    cache[ck] = (team.on_court_pids, v)
+    return v
+
+
+def _orb_base(game_cfg: "GameConfig") -> float:
+    """ORB base probability (era orb_base x orb_base_mult knob); constant for a GameConfig."""
+    return game_cfg.derived("orb_base", _compute_orb_base)
+
+
+def _compute_orb_base(game_cfg: "GameConfig") -> float:
+    pm = game_cfg.prob_model if is_mapping(game_cfg.prob_model) else DEFAULT_PROB_MODEL
+    return float(pm.get("orb_base", 0.26)) * _knob_mult(game_cfg, "orb_base_mult", 1.0)
+
+
 def rebound_orb_probability(
     offense: TeamState,
     defense: TeamState,
@@ -55,14 +97,11 @@ def rebound_orb_probability(
     drb_mult: float,
     game_cfg: "GameConfig",
 ) -> float:
-    off_players = offense.on_court_players()
-    def_players = defense.on_court_players()
-    off_orb = sum(p.get("REB_OR") for p in off_players) / max(len(off_players), 1)
-    def_drb = sum(p.get("REB_DR") for p in def_players) / max(len(def_players), 1)
+    off_orb = _on_court_mean(offense, "REB_OR")
+    def_drb = _on_court_mean(defense, "REB_DR")
     off_orb *= orb_mult
     def_drb *= drb_mult
-    pm = game_cfg.prob_model if isinstance(game_cfg.prob_model, Mapping) else DEFAULT_PROB_MODEL
-    base = float(pm.get("orb_base", 0.26)) * _knob_mult(game_cfg, "orb_base_mult", 1.0)
+    base = _orb_base(game_cfg)
     return prob_from_scores(
         None,
         base,
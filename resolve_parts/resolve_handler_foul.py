@@ -4,6 +4,7 @@ from collections.abc import Mapping
 from typing import Any, Dict, Tuple
 
 from ..core import clamp
+from ..game_config import is_mapping
 from ..def_role_players import get_or_build_def_role_players, engine_get_stat
 from ..participants import choose_assister_weighted, choose_fouler_pid
 from ..prob import _shot_kind_from_outcome, prob_from_scores
@@ -197,7 +198,7 @@ def handle_foul(
         if debug_q:
             foul_dbg = {"q_score": float(q_score), "q_delta": float(q_delta), "q_detail": q_detail, "carry_in": float(carry_in)}
 
-        shot_base = game_cfg.shot_base if isinstance(game_cfg.shot_base, Mapping) else {}
+        shot_base = game_cfg.shot_base if is_mapping(game_cfg.shot_base) else {}
         base_p = shot_base.get(shot_key, 0.45)
         kind = _shot_kind_from_outcome(shot_key)
         if kind == "shot_rim":
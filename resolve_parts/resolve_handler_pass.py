@@ -5,6 +5,7 @@ from collections.abc import Mapping
 from typing import Any, Dict, Tuple
 
 from ..core import clamp, dot_profile, sigmoid
+from ..game_config import is_mapping
 from ..def_role_players import get_or_build_def_role_players, engine_get_stat
 from ..profiles import OUTCOME_PROFILES
 from ..prob import _team_variance_mult, prob_from_scores
@@ -42,7 +43,7 @@ def handle_pass(
     double_doubler_pid = rc.double_doubler_pid
     double_source = getattr(rc, "double_source", None)
 
-    pass_base = game_cfg.pass_base_success if isinstance(game_cfg.pass_base_success, Mapping) else {}
+    pass_base = game_cfg.pass_base_success if is_mapping(game_cfg.pass_base_success) else {}
     base_s = pass_base.get(outcome, 0.90) * _knob_mult(game_cfg, "pass_base_success_mult", 1.0)
 
     # PASS completion (offense vs defense) - this preserves passer skill influence.
@@ -118,9 +119,9 @@ def handle_pass(
     if compute_passer:
         try:
             prof = OUTCOME_PROFILES.get(outcome, {}).get("offense")
-            if not isinstance(prof, dict) or not prof:
+            if not isinstance(prof, Mapping) or not prof:
                 prof = OUTCOME_PROFILES.get("TO_BAD_PASS", {}).get("offense")
-            if isinstance(prof, dict) and prof:
+            if isinstance(prof, Mapping) and prof:
                 vals = {k: float(actor.get(k, fatigue_sensitive=True)) for k in prof.keys()}
                 passer_bp = float(dot_profile(vals, prof, missing_default=50.0))
                 bp_norm = float(clamp((passer_bp - 50.0) / 50.0, -1.0, 1.0))
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
 from typing import Any, Dict, Tuple
 
 from ..builders import get_action_base
 from ..core import clamp
+from ..game_config import is_mapping
 from ..def_role_players import get_or_build_def_role_players, engine_get_stat
 from ..prob import _shot_kind_from_outcome, _team_variance_mult, prob_from_scores
 from ..participants import choose_assister_weighted, choose_blocker_pid
@@ -85,7 +85,7 @@ def handle_shot(
     shot_dbg = {}
     if debug_q:
         shot_dbg = {"q_score": float(q_score), "q_delta": float(q_delta), "q_detail": q_detail, "carry_in": float(carry_in)}
-    shot_base = game_cfg.shot_base if isinstance(game_cfg.shot_base, Mapping) else {}
+    shot_base = game_cfg.shot_base if is_mapping(game_cfg.shot_base) else {}
     base_p = shot_base.get(outcome, 0.45)
     kind = _shot_kind_from_outcome(outcome)
     if kind == "shot_rim":
@@ -1,7 +1,7 @@
 # role_fit.py
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 
 # If your project has concrete Player / TeamState classes, you can type-import them here.
@@ -106,18 +106,27 @@ except ImportError:  # pragma: no cover
 # -----------------------------
 # Fit score / grade
 # -----------------------------
+# ROLE_FIT_WEIGHTS baked into dense rows: role -> ((stat_key, weight), ...), weights already
+# float. Roles with an empty weight dict are omitted so they fall through to the 50.0 default.
+_ROLE_FIT_ROWS: Dict[str, Tuple[Tuple[str, float], ...]] = {
+    role: tuple((k, float(a)) for k, a in w.items())
+    for role, w in ROLE_FIT_WEIGHTS.items()
+    if w
+}
+
+
 def role_fit_score(player: Player, role: str) -> float:
-    w = ROLE_FIT_WEIGHTS.get(role)
-    if not w:
+    row = _ROLE_FIT_ROWS.get(role)
+    if row is None:
         return 50.0
     s = 0.0
-    for k, a in w.items():
+    for k, a in row:
         # defensive: player.get(k) might be None depending on your data model
         try:
             v = player.get(k)
         except Exception:
             v = 0.0
-        s += float(v or 0.0) * float(a)
+        s += float(v or 0.0) * a
     return clamp(s, 0.0, 100.0)
 
 
@@ -169,8 +178,14 @@ def _role_fit_default_cuts() -> Tuple[float, float, float, float]:
     return (80.0, 72.0, 60.0, 52.0)
 
 
-def role_fit_g(role: str, fit: float) -> float:
-    """Continuous grade coordinate in [-2, +2] for a given (role, fit)."""
+# role -> validated float cuts for role_fit_g (ROLE_FIT_CUTS is static data).
+_ROLE_G_CUTS: Dict[str, Tuple[float, float, float, float]] = {}
+
+
+def _role_g_cuts(role: str) -> Tuple[float, float, float, float]:
+    cached = _ROLE_G_CUTS.get(role)
+    if cached is not None:
+        return cached
     cuts = ROLE_FIT_CUTS.get(role) or _role_fit_default_cuts()
     try:
         s_min, a_min, b_min, c_min = [float(x) for x in cuts]
@@ -180,6 +195,13 @@ def role_fit_g(role: str, fit: float) -> float:
     # Defensive ordering checks; if malformed, fall back.
     if not (s_min >= a_min >= b_min >= c_min):
         s_min, a_min, b_min, c_min = _role_fit_default_cuts()
+    cached = _ROLE_G_CUTS[role] = (s_min, a_min, b_min, c_min)
+    return cached
+
+
+def role_fit_g(role: str, fit: float) -> float:
+    """Continuous grade coordinate in [-2, +2] for a given (role, fit)."""
+    s_min, a_min, b_min, c_min = _role_g_cuts(role)
 
     f = float(fit)
 
@@ -257,25 +279,39 @@ def _interp_grade_anchors(g: float, anchors: Dict[str, float]) -> float:
     return _lerp(aA, aS, _smoothstep01(t))
 
 
-def _role_fit_mult_raw_by_g(g: float, cat: str) -> float:
-    """Interpolate ROLE_PRIOR_MULT_RAW by continuous grade coordinate."""
+# Anchor tables built once from the static ROLE_PRIOR_MULT_RAW / ROLE_LOGIT_DELTA_RAW data.
+_MULT_RAW_ANCHORS: Dict[str, Dict[str, float]] = {}
+_DELTA_RAW_ANCHORS: Dict[str, float] = {}
+
+
+def _mult_raw_anchors(cat: str) -> Dict[str, float]:
+    anchors = _MULT_RAW_ANCHORS.get(cat)
+    if anchors is not None:
+        return anchors
     # Anchor table: grade -> {GOOD/BAD}
-    anchors: Dict[str, float] = {}
+    anchors = {}
     for gr in ["D", "C", "B", "A", "S"]:
         try:
             anchors[gr] = float(ROLE_PRIOR_MULT_RAW.get(gr, ROLE_PRIOR_MULT_RAW["B"]).get(cat, 1.0))
         except Exception:
             anchors[gr] = 1.0
-    return float(_interp_grade_anchors(g, anchors))
+    _MULT_RAW_ANCHORS[cat] = anchors
+    return anchors
+
+
+def _role_fit_mult_raw_by_g(g: float, cat: str) -> float:
+    """Interpolate ROLE_PRIOR_MULT_RAW by continuous grade coordinate."""
+    return float(_interp_grade_anchors(g, _mult_raw_anchors(cat)))
 
 
 def _role_fit_delta_raw_by_g(g: float) -> float:
-    anchors: Dict[str, float] = {}
-    for gr in ["D", "C", "B", "A", "S"]:
-        try:
-            anchors[gr] = float(ROLE_LOGIT_DELTA_RAW.get(gr, 0.0))
-        except Exception:
-            anchors[gr] = 0.0
+    anchors = _DELTA_RAW_ANCHORS
+    if not anchors:
+        for gr in ["D", "C", "B", "A", "S"]:
+            try:
+                anchors[gr] = float(ROLE_LOGIT_DELTA_RAW.get(gr, 0.0))
+            except Exception:
+                anchors[gr] = 0.0
     return float(_interp_grade_anchors(g, anchors))
 
 
@@ -336,7 +372,19 @@ def _pid_is_on_court(offense: TeamState, pid: Any) -> bool:
     return True
 
 
-def _choose_best_role(offense: TeamState, roles: List[str]) -> Optional[Tuple[str, Player, float]]:
+def _team_role_fit(offense: TeamState, p: Player, role: str) -> float:
+    """role_fit_score memoized per (pid, role) on the team for the current possession."""
+    cache = getattr(offense, "_role_fit_cache", None)
+    if cache is None:
+        return role_fit_score(p, role)
+    key = (p.pid, role)
+    fit = cache.get(key)
+    if fit is None:
+        fit = cache[key] = role_fit_score(p, role)
+    return fit
+
+
+def _choose_best_role(offense: TeamState, roles: Sequence[str]) -> Optional[Tuple[str, Player, float]]:
     best: Optional[Tuple[str, Player, float]] = None
     for r in roles:
         pid = getattr(offense, "roles", {}).get(r)
@@ -347,144 +395,86 @@ def _choose_best_role(offense: TeamState, roles: List[str]) -> Optional[Tuple[st
         p = offense.find_player(pid)
         if not p:
             continue
-        fit = role_fit_score(p, r)
+        fit = _team_role_fit(offense, p, r)
         if best is None or fit > best[2]:
             best = (r, p, fit)
     return best
 
 
-def _collect_roles_for_action_family(action_family: str, offense: TeamState) -> List[Tuple[str, Player, float]]:
-    """
-    Collect role participants for a possession 'action_family'.
-    This is the only place that should reference specific role keys.
-    """
-    parts: List[Tuple[str, Player, float]] = []
-    fam = action_family
-
-    if fam == "PnR":
-        pick = _choose_best_role(offense, ["Initiator_Primary"])
-        if pick:
-            parts.append(pick)
-        pick = _choose_best_role(offense, ["Initiator_Secondary"])
-        if pick:
-            parts.append(pick)
-
+# action_family -> role groups; each group contributes its best-fitting on-court role
+# (if any), in order. This is the only place that should reference specific role keys.
+_FAMILY_ROLE_GROUPS: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    "PnR": (
+        ("Initiator_Primary",),
+        ("Initiator_Secondary",),
         # Roller / Short roll: evaluate both if assigned
-        for r in ["Roller_Finisher", "ShortRoll_Playmaker"]:
-            pid = offense.roles.get(r)
-            if pid and _pid_is_on_court(offense, pid):
-                p = offense.find_player(pid)
-                if p:
-                    parts.append((r, p, role_fit_score(p, r)))
-
+        ("Roller_Finisher",),
+        ("ShortRoll_Playmaker",),
         # Optional Pop big
-        pid = offense.roles.get("Pop_Spacer_Big")
-        if pid and _pid_is_on_court(offense, pid):
-            p = offense.find_player(pid)
-            if p:
-                parts.append(("Pop_Spacer_Big", p, role_fit_score(p, "Pop_Spacer_Big")))
-
-    elif fam == "PnP":
-        # Pick-and-pop: handler + pop threat big (PnR과 동급 액션으로 role-fit 참여자를 수집)
-        pick = _choose_best_role(offense, ["Initiator_Primary"])
-        if pick:
-            parts.append(pick)
-        pick = _choose_best_role(offense, ["Initiator_Secondary"])
-        if pick:
-            parts.append(pick)
-
-        pick = _choose_best_role(offense, ["Pop_Spacer_Big", "Post_Hub"])
-        if pick:
-            parts.append(pick)
-
+        ("Pop_Spacer_Big",),
+    ),
+    # Pick-and-pop: handler + pop threat big (PnR과 동급 액션으로 role-fit 참여자를 수집)
+    "PnP": (
+        ("Initiator_Primary",),
+        ("Initiator_Secondary",),
+        ("Pop_Spacer_Big", "Post_Hub"),
         # Optional: spacing/connector
-        pick = _choose_best_role(offense, ["Spacer_CatchShoot", "Spacer_Movement", "Connector_Playmaker"])
-        if pick:
-            parts.append(pick)
+        ("Spacer_CatchShoot", "Spacer_Movement", "Connector_Playmaker"),
+    ),
+    "DHO": (
+        ("Initiator_Secondary", "Connector_Playmaker"),
+        ("Spacer_Movement",),
+        ("Post_Hub", "Pop_Spacer_Big"),
+    ),
+    "Drive": (
+        ("Rim_Attacker", "Shot_Creator", "Initiator_Primary"),
+    ),
+    # On-ball creator + spacing check (ISO도 다른 액션과 동일하게 role-fit 영향권에 들어오도록)
+    "ISO": (
+        ("Shot_Creator", "Initiator_Primary", "Rim_Attacker", "Post_Hub"),
+        ("Spacer_CatchShoot", "Spacer_Movement"),
+    ),
+    "Kickout": (
+        ("Rim_Attacker", "Shot_Creator", "Initiator_Primary"),
+        ("Spacer_CatchShoot", "Spacer_Movement"),
+    ),
+    "ExtraPass": (
+        ("Connector_Playmaker",),
+        ("Initiator_Secondary", "Post_Hub"),
+    ),
+    "PostUp": (
+        ("Post_Hub",),
+        ("Spacer_CatchShoot", "Spacer_Movement"),
+    ),
+    "HornsSet": (
+        ("Initiator_Secondary", "Initiator_Primary"),
+        ("Post_Hub",),
+        ("Pop_Spacer_Big", "ShortRoll_Playmaker", "Roller_Finisher"),
+    ),
+    "SpotUp": (
+        ("Spacer_CatchShoot", "Spacer_Movement"),
+    ),
+    "Cut": (
+        ("Rim_Attacker", "Roller_Finisher"),
+        ("Connector_Playmaker", "Post_Hub", "Initiator_Secondary"),
+    ),
+    "TransitionEarly": (
+        ("Transition_Handler",),
+        ("Roller_Finisher", "Rim_Attacker"),
+        ("Spacer_CatchShoot",),
+    ),
+}
 
-    elif fam == "DHO":
-        for group in [
-            ["Initiator_Secondary", "Connector_Playmaker"],
-            ["Spacer_Movement"],
-            ["Post_Hub", "Pop_Spacer_Big"],
-        ]:
-            pick = _choose_best_role(offense, group)
-            if pick:
-                parts.append(pick)
-
-    elif fam == "Drive":
-        pick = _choose_best_role(offense, ["Rim_Attacker", "Shot_Creator", "Initiator_Primary"])
-        if pick:
-            parts.append(pick)
 
-    elif fam == "ISO":
-        # On-ball creator + spacing check (ISO도 다른 액션과 동일하게 role-fit 영향권에 들어오도록)
-        pick = _choose_best_role(offense, ["Shot_Creator", "Initiator_Primary", "Rim_Attacker", "Post_Hub"])
-        if pick:
-            parts.append(pick)
-        pick2 = _choose_best_role(offense, ["Spacer_CatchShoot", "Spacer_Movement"])
-        if pick2:
-            parts.append(pick2)
-
-    elif fam == "Kickout":
-        for group in [
-            ["Rim_Attacker", "Shot_Creator", "Initiator_Primary"],
-            ["Spacer_CatchShoot", "Spacer_Movement"],
-        ]:
-            pick = _choose_best_role(offense, group)
-            if pick:
-                parts.append(pick)
-
-    elif fam == "ExtraPass":
-        for group in [
-            ["Connector_Playmaker"],
-            ["Initiator_Secondary", "Post_Hub"],
-        ]:
-            pick = _choose_best_role(offense, group)
-            if pick:
-                parts.append(pick)
-
-    elif fam == "PostUp":
-        pick = _choose_best_role(offense, ["Post_Hub"])
-        if pick:
-            parts.append(pick)
-        pick2 = _choose_best_role(offense, ["Spacer_CatchShoot", "Spacer_Movement"])
-        if pick2:
-            parts.append(pick2)
-
-    elif fam == "HornsSet":
-        for group in [
-            ["Initiator_Secondary", "Initiator_Primary"],
-            ["Post_Hub"],
-            ["Pop_Spacer_Big", "ShortRoll_Playmaker", "Roller_Finisher"],
-        ]:
-            pick = _choose_best_role(offense, group)
-            if pick:
-                parts.append(pick)
-
-    elif fam == "SpotUp":
-        pick = _choose_best_role(offense, ["Spacer_CatchShoot", "Spacer_Movement"])
-        if pick:
-            parts.append(pick)
-
-    elif fam == "Cut":
-        pick = _choose_best_role(offense, ["Rim_Attacker", "Roller_Finisher"])
+def _collect_roles_for_action_family(action_family: str, offense: TeamState) -> List[Tuple[str, Player, float]]:
+    """
+    Collect role participants for a possession 'action_family' (see _FAMILY_ROLE_GROUPS).
+    """
+    parts: List[Tuple[str, Player, float]] = []
+    for group in _FAMILY_ROLE_GROUPS.get(action_family, ()):
+        pick = _choose_best_role(offense, group)
         if pick:
             parts.append(pick)
-        pick2 = _choose_best_role(offense, ["Connector_Playmaker", "Post_Hub", "Initiator_Secondary"])
-        if pick2:
-            parts.append(pick2)
-
-    elif fam == "TransitionEarly":
-        for group in [
-            ["Transition_Handler"],
-            ["Roller_Finisher", "Rim_Attacker"],
-            ["Spacer_CatchShoot"],
-        ]:
-            pick = _choose_best_role(offense, group)
-            if pick:
-                parts.append(pick)
-
     return parts
 
 
@@ -502,6 +492,9 @@ def _role_fit_effective_score(fits: List[float]) -> float:
     return clamp(0.70 * mn + 0.30 * av, 0.0, 100.0)
 
 
+_GRADE_SEVERITY: Dict[str, int] = {"S": 0, "A": 1, "B": 2, "C": 3, "D": 4}
+
+
 def _effective_grade_from_participants(participants: List[Tuple[str, Player, float]]) -> str:
     """
     Grade is taken as the worst (most severe) grade among participants,
@@ -509,9 +502,36 @@ def _effective_grade_from_participants(participants: List[Tuple[str, Player, flo
     """
     if not participants:
         return "B"
-    sev = {"S": 0, "A": 1, "B": 2, "C": 3, "D": 4}
-    grades = [role_fit_grade(r, f) for (r, _, f) in participants]
-    return max(grades, key=lambda g: sev.get(g, 2))
+    worst = ""
+    worst_sev = -1
+    for (r, _, f) in participants:
+        g = role_fit_grade(r, f)
+        sv = _GRADE_SEVERITY.get(g, 2)
+        if sv > worst_sev:  # strict: first of equally severe grades wins, as with max()
+            worst, worst_sev = g, sv
+    return worst
+
+
+# outcome -> role-fit category ("GOOD"/"BAD"/None); the outcome vocabulary is fixed, so
+# each key is classified once instead of re-running the prefix checks every step.
+_OUTCOME_FIT_CAT: Dict[str, Optional[str]] = {}
+_MISSING = object()
+
+
+def _outcome_fit_cat(o: str) -> Optional[str]:
+    # IMPORTANT: keep FOUL_DRAW as GOOD, and do not overwrite it later.
+    if o.startswith("FOUL_DRAW_"):
+        cat = "GOOD"
+    elif o.startswith("FOUL_"):
+        cat = None
+    elif o.startswith("SHOT_") or o.startswith("PASS_"):
+        cat = "GOOD"
+    elif o.startswith("TO_") or o.startswith("RESET_"):
+        cat = "BAD"
+    else:
+        cat = None
+    _OUTCOME_FIT_CAT[o] = cat
+    return cat
 
 
 def apply_role_fit_to_priors_and_tags(
@@ -523,7 +543,12 @@ def apply_role_fit_to_priors_and_tags(
 ) -> Dict[str, float]:
     role_fit_cfg = game_cfg.role_fit if game_cfg is not None else None
     strength = _get_role_fit_strength(offense, role_fit_cfg=role_fit_cfg)
-    participants = _collect_roles_for_action_family(action_family, offense)
+    # With role-fit disabled (strength ~0) nothing below can move priors or the logit delta,
+    # so skip participant collection and fall through the neutral (not applied) path.
+    if strength > 1e-9:
+        participants = _collect_roles_for_action_family(action_family, offense)
+    else:
+        participants = []
     applied = bool(participants)
 
     fits = [f for (_, _, f) in participants]
@@ -535,42 +560,37 @@ def apply_role_fit_to_priors_and_tags(
     g_eff = _effective_g_from_participants(participants) if applied else 0.0
     grade_bucket = _grade_bucket_from_g(g_eff) if applied else "B"
 
+    mult_raw_good = float(_role_fit_mult_raw_by_g(g_eff, "GOOD")) if applied else float(
+        ROLE_PRIOR_MULT_RAW.get("B", ROLE_PRIOR_MULT_RAW["B"]).get("GOOD", 1.0)
+    )
+    mult_raw_bad = float(_role_fit_mult_raw_by_g(g_eff, "BAD")) if applied else float(
+        ROLE_PRIOR_MULT_RAW.get("B", ROLE_PRIOR_MULT_RAW["B"]).get("BAD", 1.0)
+    )
+
     mults_applied: List[float] = []
 
     if applied and strength > 1e-9:
-        for o in list(priors.keys()):
-            # IMPORTANT: keep FOUL_DRAW as GOOD, and do not overwrite it later.
-            if o.startswith("FOUL_DRAW_"):
-                cat = "GOOD"
-            elif o.startswith("FOUL_"):
-                continue
-            else:
-                if o.startswith("SHOT_") or o.startswith("PASS_"):
-                    cat = "GOOD"
-                elif o.startswith("TO_") or o.startswith("RESET_"):
-                    cat = "BAD"
-                else:
-                    cat = None
-
-            if not cat:
-                continue
-
-            mult_raw = _role_fit_mult_raw_by_g(g_eff, cat)
-            mult_final = 1.0 + (0.60 * strength) * (float(mult_raw) - 1.0)
-            priors[o] *= mult_final
-            mults_applied.append(mult_final)
+        # g_eff/strength are fixed for the step, so each category has a single final multiplier.
+        mult_final_by_cat = {
+            "GOOD": 1.0 + (0.60 * strength) * (mult_raw_good - 1.0),
+            "BAD": 1.0 + (0.60 * strength) * (mult_raw_bad - 1.0),
+        }
+        # Multiply in place (priors is a fresh per-step dict), then renormalize through
+        # normalize_weights so non-numeric, negative and all-zero rows keep its handling.
+        cat_get = _OUTCOME_FIT_CAT.get
+        for o, v in priors.items():
+            cat = cat_get(o, _MISSING)
+            if cat is _MISSING:
+                cat = _outcome_fit_cat(o)
+            if cat:
+                mult_final = mult_final_by_cat[cat]
+                priors[o] = v * mult_final
+                mults_applied.append(mult_final)
 
         priors = normalize_weights(priors)
 
     avg_mult_final = (sum(mults_applied) / len(mults_applied)) if mults_applied else 1.0
 
-    mult_raw_good = float(_role_fit_mult_raw_by_g(g_eff, "GOOD")) if applied else float(
-        ROLE_PRIOR_MULT_RAW.get("B", ROLE_PRIOR_MULT_RAW["B"]).get("GOOD", 1.0)
-    )
-    mult_raw_bad = float(_role_fit_mult_raw_by_g(g_eff, "BAD")) if applied else float(
-        ROLE_PRIOR_MULT_RAW.get("B", ROLE_PRIOR_MULT_RAW["B"]).get("BAD", 1.0)
-    )
-
     delta_raw = float(_role_fit_delta_raw_by_g(g_eff)) if applied else 0.0
     delta_final = (0.40 * strength) * delta_raw if applied else 0.0
 
@@ -181,27 +181,42 @@ def _apply_fatigue_loss(
     # Engine-internal fatigue dict keys are team_id only (no 'home'/'away', no side mapping).
     fat_map = game_state.fatigue.setdefault(tid, {})
 
+    # Loop invariants: time scale, intensity weights and their add-ons are the same for
+    # every on-court player; only the archetype base loss and capacity vary per pid.
+    time_scale = float(elapsed_sec) / ref_sec
+
+    # Intensity values may be booleans (legacy) or floats in [0,1] (weighted).
+    try:
+        trans_w = float(intensity.get("transition_emphasis", 0.0) or 0.0)
+    except Exception:
+        trans_w = 0.0
+    try:
+        pnr_w = float(intensity.get("heavy_pnr", 0.0) or 0.0)
+    except Exception:
+        pnr_w = 0.0
+
+    trans_add = 0.0
+    if trans_w > 0.0:
+        trans_add = trans_w * float(rules.get("fatigue_loss", {}).get("transition_emphasis", 0.001)) * time_scale
+    pnr_add = 0.0
+    if pnr_w > 0.0:
+        pnr_add = pnr_w * float(rules.get("fatigue_loss", {}).get("heavy_pnr", 0.001)) * time_scale
+
+    base_loss_by_role: Dict[str, float] = {}
+
     for pid in on_court:
         # Use configured offensive roles if available; otherwise fallback to legacy role+position heuristics.
         role = _fatigue_archetype_for_pid(team, pid, role_by_pid)
 
         # 기존 룰(포제션당 소모)을 시간 비례로 변환
-        loss = _fatigue_loss_for_role(role, rules) * (float(elapsed_sec) / ref_sec)
-
-        # Intensity values may be booleans (legacy) or floats in [0,1] (weighted).
-        try:
-            trans_w = float(intensity.get("transition_emphasis", 0.0) or 0.0)
-        except Exception:
-            trans_w = 0.0
-        try:
-            pnr_w = float(intensity.get("heavy_pnr", 0.0) or 0.0)
-        except Exception:
-            pnr_w = 0.0
+        loss = base_loss_by_role.get(role)
+        if loss is None:
+            loss = base_loss_by_role[role] = _fatigue_loss_for_role(role, rules) * time_scale
 
         if trans_w > 0.0:
-            loss += trans_w * float(rules.get("fatigue_loss", {}).get("transition_emphasis", 0.001)) * (float(elapsed_sec) / ref_sec)
+            loss += trans_add
         if pnr_w > 0.0 and role in ("handler", "big"):
-            loss += pnr_w * float(rules.get("fatigue_loss", {}).get("heavy_pnr", 0.001)) * (float(elapsed_sec) / ref_sec)
+            loss += pnr_add
 
         c01 = cap01(pid)
         loss *= lerp(drain_lo, drain_hi, c01)
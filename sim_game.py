@@ -5,21 +5,24 @@ from __future__ import annotations
 NOTE: Split from sim.py on 2025-12-27.
 """
 
+import os
 import random
 import math
-from typing import Any, Dict, Optional, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from typing import Any, Dict, Optional, List, Sequence, Tuple
 
 import schema
 
-from .core import ENGINE_VERSION, make_replay_token, clamp
-from .models import GameState, TeamState
+from .core import ENGINE_VERSION, LazyReplayToken, clamp
+from .models import GameState, TeamState, new_player_stat_line
 from .replay import emit_event
 from .validation import (
     ValidationConfig,
     ValidationReport,
     validate_and_sanitize_team,
 )
-from .game_config import build_game_config
+from .game_config import GameConfig, build_game_config
 from .era import get_mvp_rules, load_era_config
 
 from .sim_clock import apply_dead_ball_cost
@@ -160,17 +163,7 @@ def init_player_boxes(team: TeamState) -> None:
     for p in team.lineup:
         # Initialize all tracked boxscore keys to keep downstream reporting stable.
         # (Some keys may be absent if legacy callers bypass init_player_boxes.)
-        team.player_stats[p.pid] = {
-            "PTS": 0,
-            "FGM": 0, "FGA": 0,
-            "3PM": 0, "3PA": 0,
-            "FTM": 0, "FTA": 0,
-            "ORB": 0, "DRB": 0,
-            "AST": 0,
-            "STL": 0,
-            "BLK": 0,
-            "TOV": 0,
-        }
+        team.player_stats[p.pid] = new_player_stat_line()
 
 def _safe_pct(made: int, att: int) -> float:
     return round((float(made) / float(att)) * 100.0, 2) if att else 0.0
@@ -224,8 +217,12 @@ def summarize_team(
     tid = str(getattr(team, "team_id", "") or "").strip()
     fat_map = game_state.fatigue.get(tid, {}) if game_state is not None else {}
     # Team-level STL/BLK are derived from per-player credits.
-    stl_total = sum(int((team.player_stats.get(pid, {}) or {}).get("STL", 0)) for pid in team.player_stats.keys())
-    blk_total = sum(int((team.player_stats.get(pid, {}) or {}).get("BLK", 0)) for pid in team.player_stats.keys())
+    stl_total = 0
+    blk_total = 0
+    for line in team.player_stats.values():
+        if line:
+            stl_total += int(line.get("STL", 0))
+            blk_total += int(line.get("BLK", 0))
     return {
         "PTS": team.pts,
         "FGM": team.fgm, "FGA": team.fga,
@@ -243,8 +240,10 @@ def summarize_team(
         "PointsOffTOV": team.points_off_tov,
         "PossessionEndCounts": dict(team.possession_end_counts),
         "ShotZoneDetail": dict(team.shot_zone_detail),
-        "OffActionCounts": dict(sorted(team.off_action_counts.items(), key=lambda x: -x[1])),
-        "OutcomeCounts": dict(sorted(team.outcome_counts.items(), key=lambda x: -x[1])),
+        # Full count tables (not top-N), descending; reverse=True keeps the sort stable, so
+        # ties stay in first-seen order exactly as with the old negated key.
+        "OffActionCounts": dict(sorted(team.off_action_counts.items(), key=itemgetter(1), reverse=True)),
+        "OutcomeCounts": dict(sorted(team.outcome_counts.items(), key=itemgetter(1), reverse=True)),
         "Players": team.player_stats,
         "PlayerBox": build_player_box(team, game_state),
         "AvgFatigue": (sum((fat_map.get(p.pid, 1.0) if game_state else 1.0) for p in team.lineup) / max(len(team.lineup), 1)),
@@ -261,6 +260,7 @@ def simulate_game(
     strict_validation: bool = True,
     validation: Optional[ValidationConfig] = None,
     replay_disabled: bool = False,
+    game_cfg: Optional[GameConfig] = None,
 ) -> Dict[str, Any]:
     """Simulate a full game with input validation/sanitization.
 
@@ -268,6 +268,9 @@ def simulate_game(
     - clamps all UI multipliers to [0.70, 1.40]
     - ignores unknown tactic keys (but logs warnings)
     - validates required derived keys (error by default; can 'fill' via ValidationConfig)
+
+    game_cfg: prebuilt GameConfig for `era` (batch runs). When given, the era config is
+    not re-frozen per game; it must have been built from the same `era`.
     """
     report = ValidationReport()
     cfg = validation if validation is not None else ValidationConfig(strict=strict_validation)
@@ -294,13 +297,15 @@ def simulate_game(
         )
 
     # 0-1: load era tuning parameters (priors/base%/scheme multipliers/prob model)
+    # (load_era_config is cached; warnings/errors are reported per game either way)
     era_cfg, era_warnings, era_errors = load_era_config(era)
     for w in era_warnings:
         report.warn(f"era[{era}]: {w}")
     for e in era_errors:
         report.error(f"era[{era}]: {e}")
 
-    game_cfg = build_game_config(era_cfg)
+    if game_cfg is None:
+        game_cfg = build_game_config(era_cfg)
 
     # If caller did not pass a custom ValidationConfig, adopt knob clamp bounds from era.
     if validation is None:
@@ -316,7 +321,8 @@ def simulate_game(
     if cfg.strict and report.errors:
         # Raise with a compact, actionable message (full list is also in report)
         head = "\n".join(report.errors[:6])
-        more = f"\n... (+{len(report.errors)-6} more)" if len(report.errors) > 6 else ""
+        n_errors = report.error_count
+        more = f"\n... (+{n_errors-6} more)" if n_errors > 6 else ""
         raise ValueError(f"MatchEngine input validation failed:\n{head}{more}")
 
     init_player_boxes(home)
@@ -1237,7 +1243,8 @@ def simulate_game(
                 {"event_type": "PERIOD_END", "q_index": int(q)},
             )
 
-        replay_token = make_replay_token(rng, home, away, era=era)
+        # Only the last period's token is reported; defer hashing until the result is built.
+        replay_token = LazyReplayToken(rng, home, away, era=era)
 
     def _apply_period_break(break_sec: float) -> None:
         if break_sec <= 0:
@@ -1277,7 +1284,7 @@ def simulate_game(
             "engine_version": ENGINE_VERSION,
             "era": era,
             "era_version": str(game_cfg.era.get("version", "1.0")),
-            "replay_token": replay_token,
+            "replay_token": str(replay_token),
             "overtime_periods": overtime_periods,
             "validation": report.to_dict(),
             "internal_debug": {
@@ -1316,3 +1323,96 @@ def simulate_game(
             "minutes_played_sec": dict(game_state.minutes_played_sec),
         }
     }
+
+
+def simulate_games_batch(
+    rng: random.Random,
+    games: Sequence[Tuple[TeamState, TeamState, schema.GameContext]],
+    *,
+    era: str = "default",
+    strict_validation: bool = True,
+    validation: Optional[ValidationConfig] = None,
+    replay_disabled: bool = True,
+) -> List[Dict[str, Any]]:
+    """Simulate many (home, away, context) games sequentially on one RNG stream.
+
+    The era is frozen into a single GameConfig shared by the whole batch; per-game
+    output is identical to calling simulate_game() in a loop with the same rng.
+    """
+    era_cfg, _, _ = load_era_config(era)
+    game_cfg = build_game_config(era_cfg)
+    return [
+        simulate_game(
+            rng,
+            home,
+            away,
+            context=context,
+            era=era,
+            strict_validation=strict_validation,
+            validation=validation,
+            replay_disabled=replay_disabled,
+            game_cfg=game_cfg,
+        )
+        for home, away, context in games
+    ]
+
+
+# Per-worker GameConfig for simulate_games_parallel (built once by the pool initializer).
+_WORKER_GAME_CFG: Optional[Tuple[str, GameConfig]] = None
+
+
+def _parallel_worker_init(era: str) -> None:
+    global _WORKER_GAME_CFG
+    era_cfg, _, _ = load_era_config(era)
+    _WORKER_GAME_CFG = (era, build_game_config(era_cfg))
+
+
+def _simulate_seeded_game(
+    job: Tuple[int, TeamState, TeamState, schema.GameContext, str, bool, Optional[ValidationConfig], bool],
+) -> Dict[str, Any]:
+    seed, home, away, context, era, strict_validation, validation, replay_disabled = job
+    cached = _WORKER_GAME_CFG
+    if cached is None or cached[0] != era:
+        _parallel_worker_init(era)
+        cached = _WORKER_GAME_CFG
+    return simulate_game(
+        random.Random(seed),
+        home,
+        away,
+        context=context,
+        era=era,
+        strict_validation=strict_validation,
+        validation=validation,
+        replay_disabled=replay_disabled,
+        game_cfg=cached[1],
+    )
+
+
+def simulate_games_parallel(
+    games: Sequence[Tuple[TeamState, TeamState, schema.GameContext]],
+    *,
+    base_seed: int,
+    max_workers: Optional[int] = None,
+    era: str = "default",
+    strict_validation: bool = True,
+    validation: Optional[ValidationConfig] = None,
+    replay_disabled: bool = True,
+) -> List[Dict[str, Any]]:
+    """Simulate independent (home, away, context) games across worker processes.
+
+    Game i runs on its own random.Random(base_seed + i), so results (returned in input
+    order) do not depend on max_workers or scheduling; max_workers=1 runs in-process.
+    Unlike simulate_games_batch this is NOT the same stream as a sequential loop on one
+    rng. With a pool the teams are pickled to the workers, so the caller's TeamState
+    objects are not updated (use the returned results). Workers build the GameConfig once.
+    """
+    jobs = [
+        (int(base_seed) + i, home, away, context, era, bool(strict_validation), validation, bool(replay_disabled))
+        for i, (home, away, context) in enumerate(games)
+    ]
+    workers = int(max_workers) if max_workers is not None else (os.cpu_count() or 1)
+    if workers <= 1 or len(jobs) <= 1:
+        return [_simulate_seeded_game(job) for job in jobs]
+    chunksize = max(1, len(jobs) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_parallel_worker_init, initargs=(era,)) as pool:
+        return list(pool.map(_simulate_seeded_game, jobs, chunksize=chunksize))
@@ -105,6 +105,10 @@ def simulate_possession(
     # In those cases, the game loop will call simulate_possession again with ctx['_pos_continuation']=True.
     # We must avoid double-counting possessions and must preserve possession-scope aggregates.
     is_continuation = bool(ctx.get("_pos_continuation", False))
+    # Energy and on-court groups are re-synced before every call (continuations included),
+    # so role-fit scores / rating means computed during the previous call may be stale.
+    offense.clear_possession_caches()
+    defense.clear_possession_caches()
     if not is_continuation:
         offense.possessions += 1
         before_pts = int(offense.pts)
@@ -331,7 +335,7 @@ def simulate_possession(
     choose_action_with_budget = _late_clock.choose_action_with_budget
     _apply_urgent_outcome_constraints = _late_clock.apply_urgent_outcome_constraints
 
-    off_probs = build_offense_action_probs(offense.tactics, defense.tactics, ctx=ctx, game_cfg=game_cfg)
+    off_probs = build_offense_action_probs(offense.tactics, defense.tactics, ctx=ctx, game_cfg=game_cfg, cache=offense._possession_cache)
     off_probs = _apply_contextual_action_weights(off_probs)
     off_probs = apply_team_style_to_action_probs(off_probs, team_style, game_cfg)
 
@@ -492,10 +496,12 @@ def simulate_possession(
 
 
         # shot_diet: pass ctx so outcome multipliers can apply
-        pri = build_outcome_priors(action, offense.tactics, defense.tactics, tags, ctx=ctx, game_cfg=game_cfg)
+        pri = build_outcome_priors(
+            action, offense.tactics, defense.tactics, tags, ctx=ctx, game_cfg=game_cfg, cache=offense._possession_cache
+        )
         pri = apply_team_style_to_outcome_priors(pri, team_style)
-        pri = apply_role_fit_to_priors_and_tags(pri, get_action_base(action, game_cfg), offense, tags, game_cfg=game_cfg)
-        pri = apply_quality_to_turnover_priors(pri, get_action_base(action, game_cfg), offense, defense, tags, ctx)
+        pri = apply_role_fit_to_priors_and_tags(pri, base_action_now, offense, tags, game_cfg=game_cfg)
+        pri = apply_quality_to_turnover_priors(pri, base_action_now, offense, defense, tags, ctx)
         pri = apply_help_to_priors(pri, ctx)
         pri = apply_double_to_priors(pri, ctx)
         pri = apply_rotation_advantage_to_priors(pri, ctx)
@@ -1218,7 +1224,7 @@ def simulate_possession(
                         "pos_start": pos_origin,
                         "first_fga_shotclock_sec": ctx.get("first_fga_shotclock_sec"),
                     }
-            off_probs = build_offense_action_probs(offense.tactics, defense.tactics, ctx=ctx, game_cfg=game_cfg)
+            off_probs = build_offense_action_probs(offense.tactics, defense.tactics, ctx=ctx, game_cfg=game_cfg, cache=offense._possession_cache)
             off_probs = _apply_contextual_action_weights(off_probs)
             off_probs = apply_team_style_to_action_probs(off_probs, team_style, game_cfg)
             action = choose_action_with_budget(rng, off_probs)
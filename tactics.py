@@ -1,33 +1,79 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass, field
-from typing import Any, Dict
+import sys
+from typing import Any, Dict, Optional
 
 
 # -------------------------
 # Tactics config
 # -------------------------
 
-@dataclass
 class TacticsConfig:
-    offense_scheme: str = "Spread_HeavyPnR"
-    defense_scheme: str = "Drop"
-    scheme_weight_sharpness: float = 1.00
-    scheme_outcome_strength: float = 1.00
-    def_scheme_weight_sharpness: float = 1.00
-    def_scheme_outcome_strength: float = 1.00
-
-    action_weight_mult: Dict[str, float] = field(default_factory=dict)
-    outcome_global_mult: Dict[str, float] = field(default_factory=dict)
-    outcome_by_action_mult: Dict[str, Dict[str, float]] = field(default_factory=dict)
-
-    opp_action_weight_mult: Dict[str, float] = field(default_factory=dict)
-
-    opp_outcome_global_mult: Dict[str, float] = field(default_factory=dict)
-    opp_outcome_by_action_mult: Dict[str, Dict[str, float]] = field(default_factory=dict)
-
-    context: Dict[str, Any] = field(default_factory=dict)
+    # Plain __slots__ class (dataclass(slots=True) needs 3.10+): builders read these attributes
+    # on every possession step, and slots skip the per-instance __dict__.
+    __slots__ = (
+        "offense_scheme",
+        "defense_scheme",
+        "scheme_weight_sharpness",
+        "scheme_outcome_strength",
+        "def_scheme_weight_sharpness",
+        "def_scheme_outcome_strength",
+        "action_weight_mult",
+        "outcome_global_mult",
+        "outcome_by_action_mult",
+        "opp_action_weight_mult",
+        "opp_outcome_global_mult",
+        "opp_outcome_by_action_mult",
+        "context",
+    )
+
+    def __init__(
+        self,
+        offense_scheme: str = "Spread_HeavyPnR",
+        defense_scheme: str = "Drop",
+        scheme_weight_sharpness: float = 1.00,
+        scheme_outcome_strength: float = 1.00,
+        def_scheme_weight_sharpness: float = 1.00,
+        def_scheme_outcome_strength: float = 1.00,
+        action_weight_mult: Optional[Dict[str, float]] = None,
+        outcome_global_mult: Optional[Dict[str, float]] = None,
+        outcome_by_action_mult: Optional[Dict[str, Dict[str, float]]] = None,
+        opp_action_weight_mult: Optional[Dict[str, float]] = None,
+        opp_outcome_global_mult: Optional[Dict[str, float]] = None,
+        opp_outcome_by_action_mult: Optional[Dict[str, Dict[str, float]]] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        # Scheme names key the per-step scheme tables; intern them at construction so those
+        # lookups compare by identity (validation re-interns after canonicalization).
+        self.offense_scheme = sys.intern(offense_scheme) if type(offense_scheme) is str else offense_scheme
+        self.defense_scheme = sys.intern(defense_scheme) if type(defense_scheme) is str else defense_scheme
+        self.scheme_weight_sharpness = scheme_weight_sharpness
+        self.scheme_outcome_strength = scheme_outcome_strength
+        self.def_scheme_weight_sharpness = def_scheme_weight_sharpness
+        self.def_scheme_outcome_strength = def_scheme_outcome_strength
+
+        self.action_weight_mult = {} if action_weight_mult is None else action_weight_mult
+        self.outcome_global_mult = {} if outcome_global_mult is None else outcome_global_mult
+        self.outcome_by_action_mult = {} if outcome_by_action_mult is None else outcome_by_action_mult
+
+        self.opp_action_weight_mult = {} if opp_action_weight_mult is None else opp_action_weight_mult
+
+        self.opp_outcome_global_mult = {} if opp_outcome_global_mult is None else opp_outcome_global_mult
+        self.opp_outcome_by_action_mult = {} if opp_outcome_by_action_mult is None else opp_outcome_by_action_mult
+
+        self.context = {} if context is None else context
+
+    def __repr__(self) -> str:
+        body = ", ".join(f"{k}={getattr(self, k)!r}" for k in self.__slots__)
+        return f"{type(self).__name__}({body})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, k) == getattr(other, k) for k in self.__slots__)
+
+    __hash__ = None  # mutable, like the dataclass it replaced
 
 
 # -------------------------
@@ -103,6 +149,9 @@ def canonical_defense_scheme(value: Any) -> str:
     - Returns one of _CANON_DEFENSE_SCHEMES when recognized.
     - Otherwise returns the original string (caller should validate/fallback).
     """
+    # Hot path: sanitized tactics already hold the canonical key (called every step).
+    if type(value) is str and value in _CANON_DEFENSE_SCHEMES:
+        return value
     if value is None:
         s = ""
     else:
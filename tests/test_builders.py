@@ -0,0 +1,45 @@
+from ..builders import build_offense_action_probs, build_outcome_priors
+from ..era import load_era_config
+from ..game_config import build_game_config
+from ..tactics import TacticsConfig
+
+
+def _game_cfg():
+    cfg, _, _ = load_era_config("default")
+    return build_game_config(cfg)
+
+
+def test_outcome_priors_follow_in_place_tactics_edits():
+    game_cfg = _game_cfg()
+    off, de = TacticsConfig(), TacticsConfig()
+    before = build_outcome_priors("PnR", off, de, {}, game_cfg=game_cfg)
+
+    off.outcome_global_mult["SHOT_3_OD"] = 3.0
+    after = build_outcome_priors("PnR", off, de, {}, game_cfg=game_cfg)
+
+    assert after["SHOT_3_OD"] > before["SHOT_3_OD"]
+
+
+def test_action_probs_follow_in_place_tactics_edits():
+    game_cfg = _game_cfg()
+    off, de = TacticsConfig(), TacticsConfig()
+    before = build_offense_action_probs(off, de, game_cfg=game_cfg)
+
+    de.opp_action_weight_mult["PnR"] = 0.2
+    after = build_offense_action_probs(off, de, game_cfg=game_cfg)
+
+    assert after["PnR"] < before["PnR"]
+
+
+def test_possession_cache_matches_uncached_result():
+    game_cfg = _game_cfg()
+    off, de = TacticsConfig(), TacticsConfig(defense_scheme="ICE_SidePnR")
+    cache = {}
+    tags = {"is_side_pnr": True}
+    for _ in range(2):
+        assert build_outcome_priors("PnR", off, de, tags, game_cfg=game_cfg, cache=cache) == build_outcome_priors(
+            "PnR", off, de, tags, game_cfg=game_cfg
+        )
+        assert build_offense_action_probs(off, de, game_cfg=game_cfg, cache=cache) == build_offense_action_probs(
+            off, de, game_cfg=game_cfg
+        )
@@ -0,0 +1,102 @@
+import pytest
+
+from .. import builders
+from ..caches import clear_caches
+from ..era import load_era_config
+from ..game_config import build_game_config
+from ..models import _fatigue_params_for_key
+from ..prob import prob_from_scores
+from ..quality import canonical_scheme
+from ..resolve_parts.resolve_ft_rebound import _ft_params, _orb_base
+from ..tactics import TacticsConfig
+from ..validation import build_allowed_sets
+
+
+def _game_cfg(**blocks):
+    era_cfg, _, _ = load_era_config("default")
+    for name, updates in blocks.items():
+        era_cfg[name].update(updates)
+    return build_game_config(era_cfg)
+
+
+# (probe, era blocks that must change what probe returns) for each GameConfig.derived value.
+_DERIVED_CASES = {
+    "prob_snap": (
+        lambda cfg: prob_from_scores(None, 0.5, -100.0, 0.0, game_cfg=cfg),
+        {"prob_model": {"prob_min": 0.2}},
+    ),
+    "action_base_lookup": (
+        lambda cfg: builders.get_action_base("MyCustomPnR", cfg),
+        {"action_aliases": {"MyCustomPnR": "PnR"}},
+    ),
+    "action_weights": (
+        lambda cfg: builders.build_offense_action_probs(TacticsConfig(), game_cfg=cfg)["PnR"],
+        {"off_scheme_action_weights": {"Spread_HeavyPnR": {"PnR": 100.0, "Drive": 1.0}}},
+    ),
+    "scheme_mult_flat": (
+        lambda cfg: builders.build_outcome_priors("PnR", TacticsConfig(), TacticsConfig(), {}, game_cfg=cfg)["SHOT_3_OD"],
+        {"offense_scheme_mult": {"Spread_HeavyPnR": {"PnR": {"SHOT_3_OD": 3.0}}}},
+    ),
+    "allowed_sets": (
+        lambda cfg: "MyCustomPnR" in build_allowed_sets(cfg).offense_actions,
+        {"action_aliases": {"MyCustomPnR": "PnR"}},
+    ),
+    "ft_params": (_ft_params, {"prob_model": {"ft_max": 0.9}}),
+    "orb_base": (_orb_base, {"knobs": {"orb_base_mult": 2.0}}),
+}
+
+
+@pytest.mark.parametrize("probe, blocks", list(_DERIVED_CASES.values()), ids=list(_DERIVED_CASES))
+def test_derived_values_follow_a_new_game_config(probe, blocks):
+    base = _game_cfg()
+    before = probe(base)
+    assert probe(_game_cfg(**blocks)) != before
+    assert probe(base) == before
+
+
+def test_game_config_derived_computes_once_per_config():
+    calls = []
+
+    def factory(cfg):
+        calls.append(cfg)
+        return len(calls)
+
+    cfg = _game_cfg()
+    assert cfg.derived("k", factory) == 1
+    assert cfg.derived("k", factory) == 1
+    assert _game_cfg().derived("k", factory) == 2
+
+
+def test_clear_caches_resets_module_level_caches():
+    builders._defense_meta_action_ops("Drop")
+    builders._defense_meta_prior_ops("Drop", "PnR")
+    assert canonical_scheme("drop") == canonical_scheme("Drop")
+    _fatigue_params_for_key("SHOT_3_CS")
+    clear_caches()
+    assert builders._defense_meta_action_ops.cache_info().currsize == 0
+    assert builders._defense_meta_prior_ops.cache_info().currsize == 0
+    assert canonical_scheme.cache_info().currsize == 0
+    assert _fatigue_params_for_key.cache_info().currsize == 0
+
+
+def test_team_variance_mult_follows_context_edits_and_config():
+    from ..models import Player, TeamState
+    from ..prob import _team_variance_mult
+
+    team = TeamState(team_id="T", name="T", lineup=[Player(pid="p", name="P")], roles={}, tactics=TacticsConfig())
+    game_cfg = _game_cfg()
+    assert _team_variance_mult(team, game_cfg) == 1.0
+
+    team.tactics.context["VARIANCE_MULT"] = 1.2
+    assert _team_variance_mult(team, game_cfg) == 1.2
+    assert _team_variance_mult(team, _game_cfg(variance_params={"team_mult_hi": 1.1})) == 1.1
+
+
+def test_role_fit_strength_follows_context_edits():
+    from ..models import Player, TeamState
+    from ..role_fit import _get_role_fit_strength
+
+    team = TeamState(team_id="T", name="T", lineup=[Player(pid="p", name="P")], roles={}, tactics=TacticsConfig())
+    assert _get_role_fit_strength(team, {"default_strength": 0.65}) == 0.65
+    team.tactics.context["ROLE_FIT_STRENGTH"] = 0.2
+    assert _get_role_fit_strength(team, {"default_strength": 0.65}) == 0.2
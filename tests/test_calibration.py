@@ -0,0 +1,53 @@
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+from ..calibration.run import run_calibration
+from ..calibration.generate import generate_player, generate_players
+
+
+def test_calibration_workers_do_not_change_results():
+    one = run_calibration(n_games=3, seed=9, store_per_game=True, workers=1)
+    two = run_calibration(n_games=3, seed=9, store_per_game=True, workers=2)
+
+    assert one["meta"].pop("workers") == 1
+    assert two["meta"].pop("workers") == 2
+    assert one == two
+
+
+def test_generate_players_matches_single_player_draws():
+    pids = ["p0", "p1", "p2"]
+    names = ["P0", "P1", "P2"]
+    archetypes = ["lead_guard", "rim_protector", "three_d_wing"]
+
+    batch = generate_players(random.Random(4), pids=pids, names=names, archetypes=archetypes)
+    rng = random.Random(4)
+    single = [generate_player(rng, pid=p, name=n, archetype=a) for p, n, a in zip(pids, names, archetypes)]
+
+    assert [(p.pid, p.pos, p.derived) for p in batch] == [(p.pid, p.pos, p.derived) for p in single]
+    assert list(batch[0].derived) == sorted(batch[0].derived)
+
+
+_ROSTER_SCRIPT = """
+import importlib, json, random, sys
+sys.path.insert(0, sys.argv[1])
+gen = importlib.import_module(sys.argv[2] + ".calibration.generate")
+team, _ = gen.build_team(random.Random(3), team_id="H", name="H", profile=gen.PROFILES["modern"])
+print(json.dumps([[p.pid, p.derived] for p in team.lineup]))
+"""
+
+
+def test_generated_rosters_do_not_depend_on_hash_seed():
+    root = Path(__file__).resolve().parents[2]
+    pkg = __name__.split(".")[0]
+    outs = []
+    for hash_seed in ("0", "7"):
+        env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+        proc = subprocess.run(
+            [sys.executable, "-c", _ROSTER_SCRIPT, str(root), pkg],
+            env=env, capture_output=True, text=True, check=True,
+        )
+        outs.append(proc.stdout)
+    assert outs[0] == outs[1]
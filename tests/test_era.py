@@ -0,0 +1,46 @@
+import os
+
+from .. import era
+
+
+def test_load_era_config_returns_independent_copies():
+    cfg, _, _ = era.load_era_config("default")
+    cfg["knobs"]["mult_hi"] = 9.9
+    cfg["shot_base"].clear()
+
+    again, _, _ = era.load_era_config("default")
+    assert again["knobs"]["mult_hi"] == 1.4
+    assert again["shot_base"]
+    assert era.DEFAULT_ERA["knobs"]["mult_hi"] == 1.4
+    assert era.DEFAULT_ERA["shot_base"]
+
+
+def test_validate_and_fill_does_not_share_default_blocks():
+    cfg, _, _ = era.validate_and_fill_era_dict({})
+    cfg["knobs"]["mult_hi"] = 9.9
+    cfg["action_outcome_priors"].clear()
+
+    assert era.DEFAULT_ERA["knobs"]["mult_hi"] == 1.4
+    assert era.DEFAULT_ERA["action_outcome_priors"]
+
+
+def test_era_cache_keeps_one_version_per_path(tmp_path):
+    era.clear_era_cache()
+    path = tmp_path / "era_x.json"
+    for i in range(3):
+        path.write_text('{"name": "x", "version": "%d"}' % i, encoding="utf-8")
+        os.utime(path, (1000 + i, 1000 + i))
+        cfg, _, _ = era.load_era_config(str(path))
+        assert cfg["version"] == str(i)
+    assert len(era._ERA_CACHE) == 1
+
+
+def test_era_cache_is_bounded(tmp_path, monkeypatch):
+    era.clear_era_cache()
+    monkeypatch.setattr(era, "_ERA_CACHE_MAX", 2)
+    for i in range(4):
+        path = tmp_path / f"era_{i}.json"
+        path.write_text('{"name": "e%d"}' % i, encoding="utf-8")
+        era.load_era_config(str(path))
+    assert len(era._ERA_CACHE) == 2
+    era.clear_era_cache()
@@ -0,0 +1,55 @@
+import pytest
+
+from ..models import Player, TeamState
+from ..tactics import TacticsConfig
+
+
+def test_player_get_sees_in_place_derived_edits():
+    p = Player(pid="p1", name="P1", derived={"SHOT_3_CS": 50.0})
+    p.energy = 0.6
+    before = p.get("SHOT_3_CS")
+
+    p.derived["SHOT_3_CS"] = 80.0
+    after = p.get("SHOT_3_CS")
+
+    assert after > before
+    assert after == pytest.approx(80.0 * (before / 50.0))
+
+
+def test_player_get_tracks_energy():
+    p = Player(pid="p1", name="P1", derived={"SHOT_3_CS": 50.0})
+    fresh = p.get("SHOT_3_CS")
+    p.energy = 0.3
+    assert p.get("SHOT_3_CS") < fresh
+    assert p.get("SHOT_3_CS", fatigue_sensitive=False) == 50.0
+
+
+def test_team_state_does_not_mutate_roles_argument():
+    roles = {"Initiator_Primary": "p1"}
+    snapshot = dict(roles)
+    team = TeamState(
+        team_id="T",
+        name="T",
+        lineup=[Player(pid="p1", name="P1")],
+        roles=roles,
+        tactics=TacticsConfig(),
+    )
+
+    team.roles["Initiator_Secondary"] = "p1"
+
+    assert roles == snapshot
+    assert team.roles["Initiator_Primary"] == "p1"
+
+
+def test_find_player_sees_in_place_lineup_swap():
+    old = Player(pid="old", name="Old")
+    keep = Player(pid="keep", name="Keep")
+    team = TeamState(team_id="T", name="T", lineup=[old, keep], roles={}, tactics=TacticsConfig())
+    assert team.find_player("old") is old
+
+    new = Player(pid="new", name="New")
+    team.lineup[0] = new
+
+    assert team.find_player("old") is None
+    assert team.find_player("new") is new
+    assert team.find_player("keep") is keep
@@ -0,0 +1,37 @@
+import random
+
+from ..core import ENGINE_VERSION, make_replay_token
+from ..models import Player, TeamState
+from ..tactics import TacticsConfig
+
+
+def _team(team_id):
+    lineup = [
+        Player(pid=f"{team_id}_{i}", name=f"{team_id}{i}", derived={"SHOT_3_CS": 40.0 + i, "PASS_CREATE": 55.5})
+        for i in range(5)
+    ]
+    return TeamState(
+        team_id=team_id,
+        name=team_id,
+        lineup=lineup,
+        roles={"Initiator_Primary": f"{team_id}_0"},
+        tactics=TacticsConfig(outcome_global_mult={"SHOT_3_CS": 1.1}, context={"PACE_MULT": 1.02}),
+    )
+
+
+def test_replay_token_is_pinned():
+    # Changing the token encoding must come with an ENGINE_VERSION bump (and a new pin).
+    assert ENGINE_VERSION == "mvp_plus_0.3"
+    token = make_replay_token(random.Random(42), _team("H"), _team("A"), era="default")
+    assert token == "3a6c3e60ebe7"
+
+
+def test_replay_token_depends_on_rng_state_and_rosters():
+    rng = random.Random(42)
+    home, away = _team("H"), _team("A")
+    token = make_replay_token(rng, home, away)
+    assert make_replay_token(random.Random(42), home, away) == token
+    rng.random()
+    assert make_replay_token(rng, home, away) != token
+    home.lineup[0].derived["SHOT_3_CS"] = 99.0
+    assert make_replay_token(random.Random(42), home, away) != token
@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from ..calibration.generate import PROFILES, build_team
+from ..role_fit import apply_role_fit_to_priors_and_tags, normalize_weights
+
+
+def _team():
+    team, _ = build_team(random.Random(3), team_id="T", name="T", profile=PROFILES["modern"])
+    starters = ("Initiator_Primary", "Roller_Finisher", "Pop_Spacer_Big", "Shot_Creator", "Initiator_Secondary")
+    team.set_on_court([team.roles[r] for r in starters])
+    return team
+
+
+def _apply(priors):
+    tags = {}
+    out = apply_role_fit_to_priors_and_tags(dict(priors), "PnR", _team(), tags)
+    assert tags["role_fit_applied"]
+    return out
+
+
+def test_role_fit_renormalizes_like_normalize_weights():
+    priors = {"SHOT_3_OD": 0.3, "PASS_KICKOUT": 0.2, "TO_HANDLE_LOSS": 0.1, "FOUL_REACH_TRAP": 0.05}
+    out = _apply(priors)
+    assert sum(out.values()) == pytest.approx(1.0)
+    assert out == normalize_weights(out)
+
+
+def test_role_fit_keeps_negative_and_all_zero_rows_unclamped():
+    out = _apply({"SHOT_3_OD": 0.5, "TO_HANDLE_LOSS": -0.1, "FOUL_REACH_TRAP": 0.2})
+    assert out["TO_HANDLE_LOSS"] < 0.0
+    assert sum(out.values()) == pytest.approx(1.0)
+
+    zeros = {"SHOT_3_OD": 0.0, "TO_HANDLE_LOSS": 0.0}
+    assert _apply(zeros) == zeros
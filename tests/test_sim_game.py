@@ -0,0 +1,45 @@
+import json
+import random
+
+# calibration.run installs the `schema` shim that sim_game imports when the host
+# project's schema module is not on the path; import it first.
+from ..calibration.run import schema
+from ..calibration.generate import PROFILES, build_team
+from ..sim_game import simulate_game, simulate_games_batch, simulate_games_parallel
+
+
+def _games(n, seed=11):
+    rng = random.Random(seed)
+    games = []
+    for i in range(n):
+        home, _ = build_team(rng, team_id=f"H{i}", name=f"Home{i}", profile=PROFILES["modern"])
+        away, _ = build_team(rng, team_id=f"A{i}", name=f"Away{i}", profile=PROFILES["modern"])
+        ctx = schema.GameContext(game_id=f"G{i}", home_team_id=f"H{i}", away_team_id=f"A{i}")
+        games.append((home, away, ctx))
+    return games
+
+
+def _dump(results):
+    return [json.dumps(r, sort_keys=True, default=str) for r in results]
+
+
+def test_batch_matches_serial_loop():
+    rng = random.Random(5)
+    serial = [simulate_game(rng, h, a, context=c, strict_validation=False, replay_disabled=True) for h, a, c in _games(2)]
+
+    batch = simulate_games_batch(random.Random(5), _games(2), strict_validation=False)
+
+    assert _dump(batch) == _dump(serial)
+
+
+def test_parallel_matches_per_game_seeds_for_any_worker_count():
+    serial = [
+        simulate_game(random.Random(100 + i), h, a, context=c, strict_validation=False, replay_disabled=True)
+        for i, (h, a, c) in enumerate(_games(3))
+    ]
+
+    in_process = simulate_games_parallel(_games(3), base_seed=100, max_workers=1, strict_validation=False)
+    pooled = simulate_games_parallel(_games(3), base_seed=100, max_workers=2, strict_validation=False)
+
+    assert _dump(in_process) == _dump(serial)
+    assert _dump(pooled) == _dump(serial)
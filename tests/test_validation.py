@@ -0,0 +1,59 @@
+from ..era import load_era_config
+from ..game_config import build_game_config
+from ..tactics import TacticsConfig
+from ..validation import ValidationConfig, ValidationReport, sanitize_tactics_config
+
+
+def test_report_caps_messages_and_counts_the_rest():
+    report = ValidationReport(max_msgs=2)
+    for i in range(5):
+        report.warn("w%d", i)
+    report.error("e")
+    report.error("e")
+    report.error("e")
+
+    assert report.warnings == ["w0", "w1"]
+    assert report.suppressed_warnings == 3
+    assert report.suppressed_errors == 1
+    assert report.error_count == 3
+
+    out = report.to_dict()
+    assert out["warnings"][-1] == "... 3 more warnings suppressed"
+    assert out["errors"][-1] == "... 1 more errors suppressed"
+    assert out["ok"] is False
+
+
+def test_warn_without_args_keeps_percent_signs():
+    report = ValidationReport()
+    report.warn("100% literal")
+    assert report.warnings == ["100% literal"]
+
+
+def test_sanitize_unknown_keys_respect_the_cap():
+    cfg, _, _ = load_era_config("default")
+    game_cfg = build_game_config(cfg)
+    tac = TacticsConfig(
+        outcome_global_mult={f"BOGUS_{i}": 1.0 for i in range(10)},
+        outcome_by_action_mult={f"NoSuchAction_{i}": {} for i in range(10)},
+    )
+    report = ValidationReport(max_msgs=4)
+    sanitize_tactics_config(tac, ValidationConfig(strict=False), report, "T", game_cfg)
+
+    assert len(report.warnings) == 4
+    assert report.suppressed_warnings >= 16
+    assert tac.outcome_global_mult == {}
+    assert tac.outcome_by_action_mult == {}
+    assert report.to_dict()["warnings"][-1] == f"... {report.suppressed_warnings} more warnings suppressed"
+
+
+def test_allowed_sets_follow_a_new_game_config():
+    from ..validation import build_allowed_sets
+
+    cfg, _, _ = load_era_config("default")
+    base = build_allowed_sets(build_game_config(cfg))
+    cfg["off_scheme_action_weights"]["MyScheme"] = {"MyAction": 1.0}
+    extended = build_allowed_sets(build_game_config(cfg))
+
+    assert "MyScheme" not in base.offense_schemes
+    assert "MyScheme" in extended.offense_schemes
+    assert "MyAction" in extended.offense_actions
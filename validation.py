@@ -3,12 +3,13 @@ from __future__ import annotations
 from .profiles import OUTCOME_PROFILES
 
 import math
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from collections.abc import Mapping
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, TYPE_CHECKING
 
 from .core import clamp
-from .models import DERIVED_DEFAULT, Player, TeamState, ROLE_FALLBACK_RANK
+from .game_config import is_mapping
+from .models import DERIVED_DEFAULT, Player, TeamState, ROLE_FALLBACK_RANK, _intern_str
 from .tactics import TacticsConfig, canonical_defense_scheme
 
 if TYPE_CHECKING:
@@ -29,36 +30,128 @@ SHOT_DIET_SUPPORTED_OFFENSE_SCHEMES = {
 # Validation / Sanitization (Commercial-ready input safety)
 # -------------------------
 
-@dataclass
+def _slots_repr(obj: Any) -> str:
+    body = ", ".join(f"{k}={getattr(obj, k)!r}" for k in obj.__slots__)
+    return f"{type(obj).__name__}({body})"
+
+
+def _slots_eq(obj: Any, other: object) -> bool:
+    if other.__class__ is not obj.__class__:
+        return NotImplemented
+    return all(getattr(obj, k) == getattr(other, k) for k in obj.__slots__)
+
+
 class ValidationConfig:
     """Controls how strictly we validate and sanitize user inputs."""
-    strict: bool = True  # True: raise on critical issues (missing derived keys, invalid schemes, invalid lineup)
-    mult_lo: float = 0.70
-    mult_hi: float = 1.40
-    derived_lo: float = 0.0
-    derived_hi: float = 100.0
-    missing_derived_policy: str = "error"  # "error" or "fill"
-    default_derived_value: float = DERIVED_DEFAULT
-    # If True, we will clamp out-of-range numbers instead of erroring (still logs warnings).
-    clamp_out_of_range: bool = True
-
-
-@dataclass
+    # Plain __slots__ classes here and below: dataclass(slots=True) needs 3.10+.
+    __slots__ = (
+        "strict",
+        "mult_lo",
+        "mult_hi",
+        "derived_lo",
+        "derived_hi",
+        "missing_derived_policy",
+        "default_derived_value",
+        "clamp_out_of_range",
+    )
+
+    def __init__(
+        self,
+        strict: bool = True,  # True: raise on critical issues (missing derived keys, invalid schemes, invalid lineup)
+        mult_lo: float = 0.70,
+        mult_hi: float = 1.40,
+        derived_lo: float = 0.0,
+        derived_hi: float = 100.0,
+        missing_derived_policy: str = "error",  # "error" or "fill"
+        default_derived_value: float = DERIVED_DEFAULT,
+        # If True, we will clamp out-of-range numbers instead of erroring (still logs warnings).
+        clamp_out_of_range: bool = True,
+    ) -> None:
+        self.strict = strict
+        self.mult_lo = mult_lo
+        self.mult_hi = mult_hi
+        self.derived_lo = derived_lo
+        self.derived_hi = derived_hi
+        self.missing_derived_policy = missing_derived_policy
+        self.default_derived_value = default_derived_value
+        self.clamp_out_of_range = clamp_out_of_range
+
+    def __repr__(self) -> str:
+        return _slots_repr(self)
+
+    def __eq__(self, other: object) -> bool:
+        return _slots_eq(self, other)
+
+    __hash__ = None
+
+
 class ValidationReport:
-    warnings: List[str] = field(default_factory=list)
-    errors: List[str] = field(default_factory=list)
+    __slots__ = ("warnings", "errors", "max_msgs", "suppressed_warnings", "suppressed_errors")
+
+    def __init__(
+        self,
+        warnings: Optional[List[str]] = None,
+        errors: Optional[List[str]] = None,
+        # Cap on stored messages per list; a malformed tactics/roster payload can otherwise emit
+        # one message per bad key. Messages past the cap are only counted.
+        max_msgs: int = 512,
+        suppressed_warnings: int = 0,
+        suppressed_errors: int = 0,
+    ) -> None:
+        self.warnings = [] if warnings is None else warnings
+        self.errors = [] if errors is None else errors
+        self.max_msgs = max_msgs
+        self.suppressed_warnings = suppressed_warnings
+        self.suppressed_errors = suppressed_errors
+
+    def __repr__(self) -> str:
+        return _slots_repr(self)
+
+    def __eq__(self, other: object) -> bool:
+        return _slots_eq(self, other)
+
+    __hash__ = None
+
+    def warn(self, msg: str, *args: Any) -> None:
+        """Record a warning; with args, msg is a %-format applied only if it is stored."""
+        if len(self.warnings) < self.max_msgs:
+            self.warnings.append(msg % args if args else msg)
+        else:
+            self.suppressed_warnings += 1
 
-    def warn(self, msg: str) -> None:
-        self.warnings.append(msg)
+    def error(self, msg: str, *args: Any) -> None:
+        """Record an error; same lazy formatting as warn()."""
+        if len(self.errors) < self.max_msgs:
+            self.errors.append(msg % args if args else msg)
+        else:
+            self.suppressed_errors += 1
 
-    def error(self, msg: str) -> None:
-        self.errors.append(msg)
+    @property
+    def error_count(self) -> int:
+        return len(self.errors) + self.suppressed_errors
 
     def to_dict(self) -> Dict[str, Any]:
-        return {"warnings": list(self.warnings), "errors": list(self.errors), "ok": (len(self.errors) == 0)}
+        warnings = list(self.warnings)
+        errors = list(self.errors)
+        if self.suppressed_warnings:
+            warnings.append(f"... {self.suppressed_warnings} more warnings suppressed")
+        if self.suppressed_errors:
+            errors.append(f"... {self.suppressed_errors} more errors suppressed")
+        return {"warnings": warnings, "errors": errors, "ok": (self.error_count == 0)}
+
+
+_INF = float("inf")
+_NINF = -_INF
 
 
 def _is_finite_number(x: Any) -> bool:
+    # JSON-parsed values are almost always float/int/bool; check those without the
+    # float() round-trip and exception setup.
+    t = type(x)
+    if t is float:
+        return x == x and x != _INF and x != _NINF
+    if t is bool or (t is int and x.bit_length() <= 1023):
+        return True
     try:
         v = float(x)
     except Exception:
@@ -98,19 +191,25 @@ def _collect_required_derived_keys() -> List[str]:
     return sorted(keys)
 
 
-REQUIRED_DERIVED_KEYS: List[str] = _collect_required_derived_keys()
+REQUIRED_DERIVED_KEYS: Tuple[str, ...] = tuple(_collect_required_derived_keys())
+REQUIRED_DERIVED_KEYS_SET: FrozenSet[str] = frozenset(REQUIRED_DERIVED_KEYS)
 
 
 @dataclass(frozen=True)
 class AllowedSets:
-    offense_actions: set[str]
-    defense_actions: set[str]
-    outcomes: set[str]
-    offense_schemes: set[str]
-    defense_schemes: set[str]
+    offense_actions: FrozenSet[str]
+    defense_actions: FrozenSet[str]
+    outcomes: FrozenSet[str]
+    offense_schemes: FrozenSet[str]
+    defense_schemes: FrozenSet[str]
 
 
 def build_allowed_sets(game_cfg: "GameConfig") -> AllowedSets:
+    # Validation runs once per team per game against the same (immutable) config.
+    return game_cfg.derived("allowed_sets", _build_allowed_sets)
+
+
+def _build_allowed_sets(game_cfg: "GameConfig") -> AllowedSets:
     offense_actions: set[str] = set()
     defense_actions: set[str] = set()
     outcomes: set[str] = set()
@@ -145,11 +244,11 @@ def build_allowed_sets(game_cfg: "GameConfig") -> AllowedSets:
         outcomes.update(pass_base_success.keys())
 
     return AllowedSets(
-        offense_actions=offense_actions,
-        defense_actions=defense_actions,
-        outcomes=outcomes,
-        offense_schemes=offense_schemes,
-        defense_schemes=defense_schemes,
+        offense_actions=frozenset(offense_actions),
+        defense_actions=frozenset(defense_actions),
+        outcomes=frozenset(outcomes),
+        offense_schemes=frozenset(offense_schemes),
+        defense_schemes=frozenset(defense_schemes),
     )
 
 
@@ -165,13 +264,20 @@ def _sanitize_mult_dict(
     path: str,
 ) -> Dict[str, float]:
     out: Dict[str, float] = {}
-    for k, raw in (mults or {}).items():
-                # outcome key aliases (backward compatibility)
+    src = mults or {}
+    # Unknown keys via one C-level set difference; the loop below still walks src in its
+    # own order so the output dict (and warning order) match the input.
+    unknown = src.keys() - allowed_keys
+    if "TO_SHOTCLOCK" in unknown and "TO_SHOT_CLOCK" in allowed_keys:
+        unknown.discard("TO_SHOTCLOCK")
+    for k, raw in src.items():
+        is_unknown = bool(unknown) and k in unknown
+        # outcome key aliases (backward compatibility)
         if k == "TO_SHOTCLOCK":
             k = "TO_SHOT_CLOCK"
-            
-        if k not in allowed_keys:
-            report.warn(f"{path}: unknown key '{k}' ignored")
+
+        if is_unknown:
+            report.warn("%s: unknown key '%s' ignored", path, k)
             continue
         if not _is_finite_number(raw):
             msg = f"{path}.{k}: non-numeric multiplier '{raw}'"
@@ -180,11 +286,11 @@ def _sanitize_mult_dict(
             else:
                 report.warn(msg + " (ignored)")
             continue
-        v = float(raw)
+        v = raw if type(raw) is float else float(raw)
         vv = _clamp_mult(v, cfg)
         if abs(vv - v) > 1e-9:
             report.warn(f"{path}.{k}: clamped {v:.3f} -> {vv:.3f}")
-        out[k] = vv
+        out[_intern_str(k)] = vv
     return out
 
 
@@ -209,9 +315,9 @@ def _sanitize_nested_outcome_by_action(
     out: Dict[str, Dict[str, float]] = {}
     for act, sub in (nested or {}).items():
         if act not in allowed_actions:
-            report.warn(f"{path}: unknown action '{act}' ignored")
+            report.warn("%s: unknown action '%s' ignored", path, act)
             continue
-        if not isinstance(sub, Mapping):
+        if not is_mapping(sub):
             msg = f"{path}.{act}: expected dict, got {type(sub).__name__}"
             if cfg.strict:
                 report.error(msg)
@@ -220,7 +326,7 @@ def _sanitize_nested_outcome_by_action(
             continue
         clean = _sanitize_outcome_mult_dict(sub, allowed_outcomes, cfg, report, f"{path}.{act}")
         if clean:
-            out[act] = clean
+            out[_intern_str(act)] = clean
     return out
 
 
@@ -262,6 +368,11 @@ def sanitize_tactics_config(
             report.warn(msg + " (fallback to Drop)")
             tac.defense_scheme = "Drop"
 
+    # Scheme names are compared against table keys/literals every possession; interning
+    # user-supplied (JSON) strings lets those == checks hit the identity fast path.
+    tac.offense_scheme = _intern_str(tac.offense_scheme)
+    tac.defense_scheme = _intern_str(tac.defense_scheme)
+
     # Scalar knobs
     for attr in ("scheme_weight_sharpness", "scheme_outcome_strength", "def_scheme_weight_sharpness", "def_scheme_outcome_strength"):
         raw = getattr(tac, attr, 1.0)
@@ -273,7 +384,7 @@ def sanitize_tactics_config(
                 report.warn(msg + " (set to 1.0)")
                 setattr(tac, attr, 1.0)
             continue
-        v = float(raw)
+        v = raw if type(raw) is float else float(raw)
         vv = _clamp_mult(v, cfg)
         if abs(vv - v) > 1e-9:
             report.warn(f"{label}.{attr}: clamped {v:.3f} -> {vv:.3f}")
@@ -384,7 +495,7 @@ def sanitize_player_derived(p: Player, cfg: ValidationConfig, report: Validation
                 continue
             report.warn(msg + " (dropped)")
             continue
-        v = float(raw)
+        v = raw if type(raw) is float else float(raw)
         if cfg.clamp_out_of_range:
             vv = clamp(v, cfg.derived_lo, cfg.derived_hi)
             if abs(vv - v) > 1e-9:
@@ -394,7 +505,8 @@ def sanitize_player_derived(p: Player, cfg: ValidationConfig, report: Validation
     p.derived = clean
 
     # Required keys
-    missing = [k for k in REQUIRED_DERIVED_KEYS if k not in p.derived]
+    missing_set = REQUIRED_DERIVED_KEYS_SET - p.derived.keys()
+    missing = [k for k in REQUIRED_DERIVED_KEYS if k in missing_set] if missing_set else []
     if missing:
         msg = f"{label}.{p.pid}: missing derived keys ({len(missing)}): {', '.join(missing[:8])}{'...' if len(missing)>8 else ''}"
         if cfg.missing_derived_policy == "fill":